@@ -13,15 +13,16 @@ import os
 import time
 from pathlib import Path
 
-# Add the project root to the Python path
+# Add the src directory to the Python path (as ./tm does), only once
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+src_dir = str(project_root / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 # Import TaskManager from the main module
 try:
-    from src.tm_production import TaskManager
-    from src.error_handler import ValidationError
-    from src.dependency_graph import CircularDependencyError
+    from tm_production import TaskManager
+    from error_handler import ValidationError
 except ImportError as e:
     print(f"Error importing TaskManager: {e}")
     print("Make sure you're running this from the task-orchestrator directory")
@@ -201,7 +202,8 @@ def demonstrate_circular_dependency_prevention():
             print(f"   ERROR: Circular dependency not detected!")
         else:
             print("   ✓ Circular dependency properly prevented")
-    except CircularDependencyError as e:
+    except ValueError as e:
+        # add() rejects dependency cycles with ValueError
         print(f"   ✓ Circular dependency detected and prevented: {e}")
 
 def demonstrate_file_references():
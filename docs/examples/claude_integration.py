@@ -25,13 +25,15 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
-# Add the project root to the Python path
+# Add the src directory to the Python path (as ./tm does), only once
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+src_dir = str(project_root / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 try:
-    from src.tm_production import TaskManager
-    from src.error_handler import ValidationError
+    from tm_production import TaskManager
+    from error_handler import ValidationError
 except ImportError as e:
     print(f"Error importing TaskManager: {e}")
     print("Make sure you're running this from the task-orchestrator directory")
@@ -17,17 +17,20 @@ Use cases covered:
 import sys
 import os
 import time
+import heapq
+import functools
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add the project root to the Python path
+# Add the src directory to the Python path (as ./tm does), only once
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+src_dir = str(project_root / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 try:
-    from src.tm_production import TaskManager
-    from src.error_handler import ValidationError
-    from src.dependency_graph import CircularDependencyError
+    from tm_production import TaskManager, Priority
+    from error_handler import ValidationError
 except ImportError as e:
     print(f"Error importing TaskManager: {e}")
     print("Make sure you're running this from the task-orchestrator directory")
@@ -39,12 +42,32 @@ def print_separator(title):
     print(f"  {title}")
     print('='*70)
 
-def print_dependency_graph(tm, title="Dependency Graph"):
-    """Print tasks showing dependency relationships."""
+class TaskNamespace:
+    """Records the tasks one demo creates so all demos can share a TaskManager."""
+    
+    def __init__(self, tm):
+        self.tm = tm
+        self.ids = set()
+    
+    def add_task(self, *args, **kwargs):
+        task_id = self.tm.add_task(*args, **kwargs)
+        self.ids.add(task_id)
+        return task_id
+    
+    def add_many(self, specs):
+        task_ids = self.tm.add_many(specs)
+        self.ids.update(task_ids)
+        return task_ids
+    
+    def list_tasks(self, **filters):
+        return [t for t in self.tm.list_tasks(**filters) if t['id'] in self.ids]
+
+def print_dependency_graph(tm, title="Dependency Graph", namespace=None):
+    """Print tasks showing dependency relationships, optionally for one namespace."""
     print(f"\n{title}:")
     print("-" * 50)
     
-    tasks = tm.list_tasks()
+    tasks = namespace.list_tasks() if namespace else tm.list_tasks()
     if not tasks:
         print("No tasks found.")
         return
@@ -75,7 +98,7 @@ def print_dependency_graph(tm, title="Dependency Graph"):
                 symbol = status_symbols.get(status, '?')
                 deps = f" ← depends on: {','.join(task['dependencies'])}" if task['dependencies'] else ""
                 blocks = f" → blocks: {','.join(task['blocks'])}" if task['blocks'] else ""
-                priority_marker = "!" if task['priority'] in ['high', 'critical'] else ""
+                priority_marker = "!" if Priority.parse(task['priority']) >= Priority.HIGH else ""
                 
                 print(f"  {symbol} [{task['id']}] {priority_marker}{task['title']}")
                 if deps:
@@ -83,17 +106,17 @@ def print_dependency_graph(tm, title="Dependency Graph"):
                 if blocks:
                     print(f"      {blocks}")
 
-def create_feature_development_workflow():
+def create_feature_development_workflow(tm):
     """Create a realistic feature development workflow with dependencies."""
     print_separator("Feature Development Workflow")
     
-    tm = TaskManager()
+    ns = TaskNamespace(tm)
     
     print("Creating a complete feature development workflow...")
     print("This simulates developing a 'User Profile Management' feature.")
     
     # 1. Planning and Design Phase
-    epic_id = tm.add_task(
+    epic_id = ns.add_task(
         "User Profile Management Feature Epic",
         description="Complete user profile management system with editing, privacy controls, and image upload",
         priority="high",
@@ -102,21 +125,21 @@ def create_feature_development_workflow():
     print(f"✓ Epic created: {epic_id}")
     
     # Design tasks
-    requirements_id = tm.add_task(
+    requirements_id = ns.add_task(
         "Gather user profile requirements",
         depends_on=[epic_id],
         priority="critical",
         tags=["planning", "requirements"]
     )
     
-    ui_design_id = tm.add_task(
+    ui_design_id = ns.add_task(
         "Design user profile UI mockups",
         depends_on=[requirements_id],
         priority="high",
         tags=["design", "ui"]
     )
     
-    api_design_id = tm.add_task(
+    api_design_id = ns.add_task(
         "Design profile API specification",
         depends_on=[requirements_id],
         priority="high",
@@ -124,21 +147,21 @@ def create_feature_development_workflow():
     )
     
     # 2. Backend Development
-    db_schema_id = tm.add_task(
+    db_schema_id = ns.add_task(
         "Create user profile database schema",
         depends_on=[api_design_id],
         priority="high",
         tags=["backend", "database"]
     )
     
-    api_impl_id = tm.add_task(
+    api_impl_id = ns.add_task(
         "Implement profile API endpoints",
         depends_on=[api_design_id, db_schema_id],
         priority="high",
         tags=["backend", "api"]
     )
     
-    image_upload_id = tm.add_task(
+    image_upload_id = ns.add_task(
         "Implement image upload service",
         depends_on=[api_design_id],
         priority="medium",
@@ -146,21 +169,21 @@ def create_feature_development_workflow():
     )
     
     # 3. Frontend Development (can start after UI design)
-    components_id = tm.add_task(
+    components_id = ns.add_task(
         "Build profile UI components",
         depends_on=[ui_design_id],
         priority="medium",
         tags=["frontend", "components"]
     )
     
-    forms_id = tm.add_task(
+    forms_id = ns.add_task(
         "Create profile edit forms",
         depends_on=[components_id],
         priority="medium",
         tags=["frontend", "forms"]
     )
     
-    integration_id = tm.add_task(
+    integration_id = ns.add_task(
         "Integrate frontend with API",
         depends_on=[forms_id, api_impl_id],
         priority="high",
@@ -168,21 +191,21 @@ def create_feature_development_workflow():
     )
     
     # 4. Testing Phase
-    backend_tests_id = tm.add_task(
+    backend_tests_id = ns.add_task(
         "Write backend unit tests",
         depends_on=[api_impl_id, image_upload_id],
         priority="high",
         tags=["testing", "backend"]
     )
     
-    frontend_tests_id = tm.add_task(
+    frontend_tests_id = ns.add_task(
         "Write frontend component tests",
         depends_on=[integration_id],
         priority="high",
         tags=["testing", "frontend"]
     )
     
-    e2e_tests_id = tm.add_task(
+    e2e_tests_id = ns.add_task(
         "Create end-to-end tests",
         depends_on=[integration_id, backend_tests_id],
         priority="medium",
@@ -190,21 +213,21 @@ def create_feature_development_workflow():
     )
     
     # 5. Deployment and Documentation
-    docs_id = tm.add_task(
+    docs_id = ns.add_task(
         "Update user documentation",
         depends_on=[integration_id],
         priority="medium",
         tags=["documentation"]
     )
     
-    deployment_id = tm.add_task(
+    deployment_id = ns.add_task(
         "Deploy to staging environment",
         depends_on=[e2e_tests_id, frontend_tests_id, docs_id],
         priority="critical",
         tags=["deployment", "staging"]
     )
     
-    print_dependency_graph(tm, "Initial Feature Workflow")
+    print_dependency_graph(tm, "Initial Feature Workflow", namespace=ns)
     
     return {
         'epic_id': epic_id,
@@ -214,43 +237,43 @@ def create_feature_development_workflow():
         'deployment_id': deployment_id
     }
 
-def simulate_parallel_development():
+def simulate_parallel_development(tm):
     """Demonstrate parallel development streams with smart dependencies."""
     print_separator("Parallel Development Coordination")
     
-    tm = TaskManager()
+    ns = TaskNamespace(tm)
     
     print("Creating parallel development streams that can work independently...")
     
     # Core infrastructure (blocking for others)
-    auth_service_id = tm.add_task(
+    auth_service_id = ns.add_task(
         "Implement authentication service",
         priority="critical",
         tags=["infrastructure", "auth"]
     )
     
-    database_id = tm.add_task(
+    database_id = ns.add_task(
         "Set up production database",
         priority="critical",
         tags=["infrastructure", "database"]
     )
     
     # Team A: User Management
-    team_a_lead_id = tm.add_task(
+    team_a_lead_id = ns.add_task(
         "User management API design",
         depends_on=[auth_service_id],
         priority="high",
         tags=["team-a", "api"]
     )
     
-    user_crud_id = tm.add_task(
+    user_crud_id = ns.add_task(
         "Implement user CRUD operations",
         depends_on=[team_a_lead_id, database_id],
         priority="high",
         tags=["team-a", "backend"]
     )
     
-    user_ui_id = tm.add_task(
+    user_ui_id = ns.add_task(
         "Build user management UI",
         depends_on=[team_a_lead_id],  # Can start with just API design
         priority="medium",
@@ -258,21 +281,21 @@ def simulate_parallel_development():
     )
     
     # Team B: Content Management (independent)
-    content_api_id = tm.add_task(
+    content_api_id = ns.add_task(
         "Content management API design",
         depends_on=[database_id],  # Only needs database
         priority="high",
         tags=["team-b", "api"]
     )
     
-    content_crud_id = tm.add_task(
+    content_crud_id = ns.add_task(
         "Implement content CRUD operations",
         depends_on=[content_api_id],
         priority="high",
         tags=["team-b", "backend"]
     )
     
-    content_ui_id = tm.add_task(
+    content_ui_id = ns.add_task(
         "Build content management UI",
         depends_on=[content_api_id],
         priority="medium",
@@ -280,14 +303,14 @@ def simulate_parallel_development():
     )
     
     # Team C: Analytics (depends on both teams)
-    analytics_design_id = tm.add_task(
+    analytics_design_id = ns.add_task(
         "Design analytics data collection",
         depends_on=[user_crud_id, content_crud_id],
         priority="medium",
         tags=["team-c", "analytics"]
     )
     
-    analytics_impl_id = tm.add_task(
+    analytics_impl_id = ns.add_task(
         "Implement analytics tracking",
         depends_on=[analytics_design_id],
         priority="low",
@@ -295,61 +318,61 @@ def simulate_parallel_development():
     )
     
     # Integration tasks (require multiple teams)
-    integration_tests_id = tm.add_task(
+    integration_tests_id = ns.add_task(
         "Cross-team integration tests",
         depends_on=[user_ui_id, content_ui_id, analytics_impl_id],
         priority="high",
         tags=["integration", "testing"]
     )
     
-    print_dependency_graph(tm, "Parallel Development Streams")
+    print_dependency_graph(tm, "Parallel Development Streams", namespace=ns)
     
     # Simulate completing infrastructure first
     print("\n1. Completing infrastructure tasks...")
     tm.complete_task(auth_service_id)
     tm.complete_task(database_id)
     
-    print_dependency_graph(tm, "After Infrastructure Completion")
+    print_dependency_graph(tm, "After Infrastructure Completion", namespace=ns)
     
     # Show how teams can now work in parallel
-    ready_tasks = tm.list_tasks(status="pending")
+    ready_tasks = ns.list_tasks(status="pending")
     print(f"\nTasks ready for parallel development: {len(ready_tasks)}")
     for task in ready_tasks:
         team = [tag for tag in task.get('tags', []) if tag.startswith('team-')]
         team_name = team[0] if team else "shared"
         print(f"  - {team_name}: [{task['id']}] {task['title']}")
 
-def demonstrate_release_workflow():
+def demonstrate_release_workflow(tm):
     """Create a complex release preparation workflow."""
     print_separator("Release Workflow Management")
     
-    tm = TaskManager()
+    ns = TaskNamespace(tm)
     
     print("Creating release preparation workflow for v2.7.2...")
     
     # Release planning
-    release_planning_id = tm.add_task(
+    release_planning_id = ns.add_task(
         "Plan v2.7.2 release scope",
         priority="critical",
         tags=["release", "planning"]
     )
     
     # Feature completion (parallel)
-    feature1_id = tm.add_task(
+    feature1_id = ns.add_task(
         "Complete authentication redesign",
         depends_on=[release_planning_id],
         priority="critical",
         tags=["release", "feature"]
     )
     
-    feature2_id = tm.add_task(
+    feature2_id = ns.add_task(
         "Complete dashboard improvements",
         depends_on=[release_planning_id],
         priority="high",
         tags=["release", "feature"]
     )
     
-    feature3_id = tm.add_task(
+    feature3_id = ns.add_task(
         "Complete mobile responsiveness",
         depends_on=[release_planning_id],
         priority="medium",
@@ -357,14 +380,14 @@ def demonstrate_release_workflow():
     )
     
     # Code quality tasks
-    security_audit_id = tm.add_task(
+    security_audit_id = ns.add_task(
         "Perform security audit",
         depends_on=[feature1_id],  # Auth changes need security review
         priority="critical",
         tags=["release", "security"]
     )
     
-    performance_testing_id = tm.add_task(
+    performance_testing_id = ns.add_task(
         "Run performance tests",
         depends_on=[feature1_id, feature2_id, feature3_id],
         priority="high",
@@ -372,21 +395,21 @@ def demonstrate_release_workflow():
     )
     
     # Documentation tasks
-    changelog_id = tm.add_task(
+    changelog_id = ns.add_task(
         "Update changelog",
         depends_on=[feature1_id, feature2_id, feature3_id],
         priority="medium",
         tags=["release", "documentation"]
     )
     
-    api_docs_id = tm.add_task(
+    api_docs_id = ns.add_task(
         "Update API documentation",
         depends_on=[feature1_id, feature2_id],  # Only features affecting API
         priority="medium",
         tags=["release", "documentation"]
     )
     
-    user_guide_id = tm.add_task(
+    user_guide_id = ns.add_task(
         "Update user guide",
         depends_on=[feature2_id, feature3_id],  # UI-affecting features
         priority="low",
@@ -394,14 +417,14 @@ def demonstrate_release_workflow():
     )
     
     # Pre-release validation
-    staging_deployment_id = tm.add_task(
+    staging_deployment_id = ns.add_task(
         "Deploy to staging",
         depends_on=[security_audit_id, performance_testing_id],
         priority="critical",
         tags=["release", "deployment"]
     )
     
-    qa_testing_id = tm.add_task(
+    qa_testing_id = ns.add_task(
         "QA acceptance testing",
         depends_on=[staging_deployment_id],
         priority="critical",
@@ -409,14 +432,14 @@ def demonstrate_release_workflow():
     )
     
     # Release tasks
-    version_bump_id = tm.add_task(
+    version_bump_id = ns.add_task(
         "Version bump and tagging",
         depends_on=[qa_testing_id, changelog_id],
         priority="critical",
         tags=["release", "versioning"]
     )
     
-    production_deployment_id = tm.add_task(
+    production_deployment_id = ns.add_task(
         "Deploy to production",
         depends_on=[version_bump_id],
         priority="critical",
@@ -424,93 +447,102 @@ def demonstrate_release_workflow():
     )
     
     # Post-release
-    monitoring_id = tm.add_task(
+    monitoring_id = ns.add_task(
         "Monitor production deployment",
         depends_on=[production_deployment_id],
         priority="high",
         tags=["release", "monitoring"]
     )
     
-    announcement_id = tm.add_task(
+    announcement_id = ns.add_task(
         "Release announcement",
         depends_on=[production_deployment_id, api_docs_id, user_guide_id],
         priority="medium",
         tags=["release", "communication"]
     )
     
-    print_dependency_graph(tm, "Release Workflow")
+    print_dependency_graph(tm, "Release Workflow", namespace=ns)
     
     # Show critical path
-    critical_tasks = tm.list_tasks()
+    critical_tasks = ns.list_tasks()
     critical_path = [t for t in critical_tasks if t['priority'] == 'critical']
     print(f"\nCritical path tasks ({len(critical_path)} tasks):")
     for task in critical_path:
         deps = f" (depends on {len(task['dependencies'])} tasks)" if task['dependencies'] else ""
         print(f"  - [{task['id']}] {task['title']}{deps}")
 
-def analyze_workflow_efficiency():
+def analyze_workflow_efficiency(tm):
     """Analyze and optimize workflow dependencies."""
     print_separator("Workflow Optimization Analysis")
     
-    tm = TaskManager()
+    ns = TaskNamespace(tm)
     
     # Create a suboptimal workflow first
     print("Creating a workflow with optimization opportunities...")
     
     # Sequential workflow (suboptimal)
-    task1 = tm.add_task("Research requirements", priority="high")
-    task2 = tm.add_task("Write specification", depends_on=[task1], priority="high")
-    task3 = tm.add_task("Design database schema", depends_on=[task2], priority="medium")
-    task4 = tm.add_task("Design API", depends_on=[task2], priority="medium")
-    task5 = tm.add_task("Design UI mockups", depends_on=[task2], priority="low")
-    task6 = tm.add_task("Implement database", depends_on=[task3], priority="medium")
-    task7 = tm.add_task("Implement API", depends_on=[task4, task6], priority="high")
-    task8 = tm.add_task("Implement UI", depends_on=[task5, task7], priority="medium")
-    task9 = tm.add_task("Integration testing", depends_on=[task8], priority="high")
-    task10 = tm.add_task("Deploy", depends_on=[task9], priority="critical")
-    
-    print_dependency_graph(tm, "Original Workflow")
+    # One batch: dependencies are batch indexes, resolved and cycle-checked
+    # in a single pass instead of one lookup per add
+    ns.add_many([
+        {"title": "Research requirements", "priority": "high"},
+        {"title": "Write specification", "depends_on": [0], "priority": "high"},
+        {"title": "Design database schema", "depends_on": [1], "priority": "medium"},
+        {"title": "Design API", "depends_on": [1], "priority": "medium"},
+        {"title": "Design UI mockups", "depends_on": [1], "priority": "low"},
+        {"title": "Implement database", "depends_on": [2], "priority": "medium"},
+        {"title": "Implement API", "depends_on": [3, 5], "priority": "high"},
+        {"title": "Implement UI", "depends_on": [4, 6], "priority": "medium"},
+        {"title": "Integration testing", "depends_on": [7], "priority": "high"},
+        {"title": "Deploy", "depends_on": [8], "priority": "high"},
+    ])
+    
+    print_dependency_graph(tm, "Original Workflow", namespace=ns)
     
     # Analyze bottlenecks
     print("\nWorkflow Analysis:")
-    all_tasks = tm.list_tasks()
+    all_tasks = ns.list_tasks()
     
     # Find tasks with no dependencies (can start immediately)
     ready_tasks = [t for t in all_tasks if not t['dependencies']]
     print(f"✓ Tasks that can start immediately: {len(ready_tasks)}")
     
-    # Find tasks that block many others
-    blocking_tasks = [(t, len(t['blocks'])) for t in all_tasks if t['blocks']]
-    blocking_tasks.sort(key=lambda x: x[1], reverse=True)
+    # Find tasks that block many others (only the top 3 are shown, so skip the full sort)
+    top_blockers = heapq.nlargest(
+        3,
+        ((t, len(t['blocks'])) for t in all_tasks if t['blocks']),
+        key=lambda x: x[1]
+    )
     print("✓ Tasks blocking the most others:")
-    for task, block_count in blocking_tasks[:3]:
+    for task, block_count in top_blockers:
         print(f"    [{task['id']}] {task['title']} (blocks {block_count} tasks)")
     
     # Find longest dependency chains
-    def get_dependency_depth(task_id, tasks_dict, visited=None):
-        if visited is None:
-            visited = set()
-        if task_id in visited:
-            return 0
-        visited.add(task_id)
-        
-        task = tasks_dict.get(task_id)
-        if not task or not task['dependencies']:
+    dependencies = {t['id']: tuple(t['dependencies']) for t in all_tasks}
+    in_progress = set()
+    
+    # Memoized per call: diamonds (A→B, A→C, B→D, C→D) reuse depth(A)
+    # instead of walking it once per path
+    @functools.cache
+    def get_dependency_depth(task_id):
+        if task_id in in_progress:
+            return 0  # cycle guard
+        deps = dependencies.get(task_id)
+        if not deps:
             return 1
         
-        max_depth = 0
-        for dep_id in task['dependencies']:
-            depth = get_dependency_depth(dep_id, tasks_dict, visited.copy())
-            max_depth = max(max_depth, depth)
-        
+        in_progress.add(task_id)
+        max_depth = max(get_dependency_depth(dep_id) for dep_id in deps)
+        in_progress.discard(task_id)
         return max_depth + 1
     
-    tasks_dict = {t['id']: t for t in all_tasks}
-    depths = [(t, get_dependency_depth(t['id'], tasks_dict)) for t in all_tasks]
-    depths.sort(key=lambda x: x[1], reverse=True)
+    deepest = heapq.nlargest(
+        3,
+        ((t, get_dependency_depth(t['id'])) for t in all_tasks),
+        key=lambda x: x[1]
+    )
     
     print("✓ Longest dependency chains:")
-    for task, depth in depths[:3]:
+    for task, depth in deepest:
         print(f"    [{task['id']}] {task['title']} (depth: {depth})")
     
     print("\nOptimization Recommendations:")
@@ -519,11 +551,11 @@ def analyze_workflow_efficiency():
     print("3. Some testing could happen in parallel with development")
     print("4. Documentation tasks could start earlier in the process")
 
-def demonstrate_advanced_patterns():
+def demonstrate_advanced_patterns(tm):
     """Show advanced dependency patterns and edge cases."""
     print_separator("Advanced Dependency Patterns")
     
-    tm = TaskManager()
+    ns = TaskNamespace(tm)
     
     print("1. Diamond Dependency Pattern:")
     print("   A common pattern where multiple tasks depend on a common ancestor")
@@ -534,10 +566,10 @@ def demonstrate_advanced_patterns():
     #    \ /
     #     D
     
-    a_id = tm.add_task("Define project requirements", priority="critical")
-    b_id = tm.add_task("Backend development", depends_on=[a_id], priority="high")
-    c_id = tm.add_task("Frontend development", depends_on=[a_id], priority="high")
-    d_id = tm.add_task("Integration testing", depends_on=[b_id, c_id], priority="high")
+    a_id = ns.add_task("Define project requirements", priority="critical")
+    b_id = ns.add_task("Backend development", depends_on=[a_id], priority="high")
+    c_id = ns.add_task("Frontend development", depends_on=[a_id], priority="high")
+    d_id = ns.add_task("Integration testing", depends_on=[b_id, c_id], priority="high")
     
     print(f"   A (requirements): {a_id}")
     print(f"   B (backend): {b_id}")
@@ -547,7 +579,7 @@ def demonstrate_advanced_patterns():
     print("\n2. Fan-out Pattern:")
     print("   One task enables many parallel tasks")
     
-    foundation_id = tm.add_task("Set up development environment", priority="critical")
+    foundation_id = ns.add_task("Set up development environment", priority="critical")
     
     parallel_tasks = []
     for i, task_name in enumerate([
@@ -557,7 +589,7 @@ def demonstrate_advanced_patterns():
         "Create project documentation template",
         "Set up monitoring"
     ]):
-        task_id = tm.add_task(task_name, depends_on=[foundation_id], priority="medium")
+        task_id = ns.add_task(task_name, depends_on=[foundation_id], priority="medium")
         parallel_tasks.append(task_id)
     
     print(f"   Foundation: {foundation_id}")
@@ -574,10 +606,10 @@ def demonstrate_advanced_patterns():
         "Complete logging",
         "Complete security review"
     ]:
-        task_id = tm.add_task(task_name, priority="high")
+        task_id = ns.add_task(task_name, priority="high")
         milestone_deps.append(task_id)
     
-    milestone_id = tm.add_task(
+    milestone_id = ns.add_task(
         "Release candidate ready",
         depends_on=milestone_deps,
         priority="critical"
@@ -585,7 +617,7 @@ def demonstrate_advanced_patterns():
     
     print(f"   Milestone: {milestone_id} (depends on {len(milestone_deps)} tasks)")
     
-    print_dependency_graph(tm, "Advanced Dependency Patterns")
+    print_dependency_graph(tm, "Advanced Dependency Patterns", namespace=ns)
 
 def main():
     """Run all dependency management demonstrations."""
@@ -595,24 +627,25 @@ def main():
     print("used in real-world development workflows.")
     
     try:
-        # Initialize clean database for examples
+        # Initialize clean database for examples; every demo shares this
+        # TaskManager and keeps its own tasks apart via a TaskNamespace
         tm = TaskManager()
         tm.init_db()
         
         # Run demonstrations
-        feature_workflow = create_feature_development_workflow()
+        feature_workflow = create_feature_development_workflow(tm)
         time.sleep(1)
         
-        simulate_parallel_development()
+        simulate_parallel_development(tm)
         time.sleep(1)
         
-        demonstrate_release_workflow()
+        demonstrate_release_workflow(tm)
         time.sleep(1)
         
-        analyze_workflow_efficiency()
+        analyze_workflow_efficiency(tm)
         time.sleep(1)
         
-        demonstrate_advanced_patterns()
+        demonstrate_advanced_patterns(tm)
         
         print_separator("Dependency Management Examples Complete")
         print("All advanced dependency patterns have been demonstrated!")
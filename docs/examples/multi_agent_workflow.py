@@ -19,23 +19,68 @@ import sys
 import os
 import time
 import random
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the project root to the Python path
+# Add the src directory to the Python path (as ./tm does), only once
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+src_dir = str(project_root / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 try:
-    from src.tm_production import TaskManager
-    from src.error_handler import ValidationError
-    from src.tm_orchestrator import Orchestrator
+    from tm_production import TaskManager
+    from error_handler import ValidationError
+    from tm_orchestrator import Orchestrator
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print("Make sure you're running this from the task-orchestrator directory")
     sys.exit(1)
 
+# Workload bars for every (active, capacity) pair up to 10, built once
+_WORKLOAD_BARS = {
+    (active, capacity): "●" * active + "○" * (capacity - active)
+    for capacity in range(11) for active in range(11)
+}
+
+def workload_bar(active: int, capacity: int) -> str:
+    """Return the ●/○ workload bar, from the prebuilt table when in range."""
+    bar = _WORKLOAD_BARS.get((active, capacity))
+    if bar is None:
+        bar = "●" * active + "○" * (capacity - active)
+    return bar
+
+# Task priorities stop at "high"; the demo's "critical" tasks map onto it
+_PRIORITY_ALIASES = {"critical": "high"}
+
+# Tags by task ID: the tasks table has no tags column, so the demo keeps
+# the tags it matches specialties against here
+_TASK_TAGS: Dict[str, List[str]] = {}
+
+def task_tags(task: Dict) -> List[str]:
+    """Tags recorded for a task row when the demo created it."""
+    return _TASK_TAGS.get(task['id'], [])
+
+def assign_specialty_masks(agents: Dict) -> Dict[str, int]:
+    """Give every specialty a bit and store each agent's 'specialty_mask'; returns tag -> bit."""
+    tag_to_bit = {}
+    for agent in agents.values():
+        mask = 0
+        for specialty in agent['specialties']:
+            mask |= tag_to_bit.setdefault(specialty, 1 << len(tag_to_bit))
+        agent['specialty_mask'] = mask
+    return tag_to_bit
+
+def tag_mask(tags: List[str], tag_to_bit: Dict[str, int]) -> int:
+    """Bitmask of the tags any agent specializes in; other tags cannot match and are skipped."""
+    mask = 0
+    for tag in tags:
+        mask |= tag_to_bit.get(tag, 0)
+    return mask
+
 def print_separator(title):
     """Print a formatted section separator."""
     print(f"\n{'='*70}")
@@ -54,18 +99,48 @@ def create_agent_profile(agent_id: str, name: str, specialties: List[str], workl
         'task_manager': None  # Will be set when needed
     }
 
-def print_team_status(agents: Dict, tm: TaskManager):
-    """Print current status of all agents and their tasks."""
+def bucket_by_assignee(tasks: List[Dict]) -> Dict[str, Dict[str, List[Dict]]]:
+    """Group task rows as {assignee: {status: [tasks]}} in one pass."""
+    buckets = defaultdict(lambda: defaultdict(list))
+    for task in tasks:
+        buckets[task.get('assignee')][task['status']].append(task)
+    return buckets
+
+def print_team_status(agents: Dict, tm: TaskManager, dirty: Optional[set] = None,
+                      last_state: Optional[Dict] = None):
+    """Print current status of all agents and their tasks.
+    
+    With dirty, only those agents are considered; with last_state (agent_id
+    -> counts, updated in place), agents whose counts are unchanged since
+    the previous call are summarized instead of reprinted.
+    """
     print("\nTeam Status:")
     print("-" * 50)
     
+    if dirty is not None and not dirty:
+        print("No changes since last update")
+        return
+    
+    # One query for the whole team instead of one per agent
+    tasks_by_agent = bucket_by_assignee(tm.list_tasks())
+    unchanged = 0
     for agent_id, agent in agents.items():
-        assigned_tasks = tm.list_tasks(assignee=agent_id)
-        in_progress = [t for t in assigned_tasks if t['status'] == 'in_progress']
-        pending = [t for t in assigned_tasks if t['status'] == 'pending']
-        completed = [t for t in assigned_tasks if t['status'] == 'completed']
+        if dirty is not None and agent_id not in dirty:
+            unchanged += 1
+            continue
+        agent_tasks = tasks_by_agent[agent_id]
+        in_progress = agent_tasks['in_progress']
+        pending = agent_tasks['pending']
+        completed = agent_tasks['completed']
         
-        workload_indicator = "●" * len(in_progress) + "○" * (agent['workload_capacity'] - len(in_progress))
+        if last_state is not None:
+            state = (len(pending), len(in_progress), len(completed))
+            if last_state.get(agent_id) == state:
+                unchanged += 1
+                continue
+            last_state[agent_id] = state
+        
+        workload_indicator = workload_bar(len(in_progress), agent['workload_capacity'])
         
         print(f"👤 {agent['name']} ({agent_id}):")
         print(f"   Specialties: {', '.join(agent['specialties'])}")
@@ -76,9 +151,17 @@ def print_team_status(agents: Dict, tm: TaskManager):
             print("   Active tasks:")
             for task in in_progress[:3]:  # Show first 3
                 print(f"     - [{task['id']}] {task['title']}")
+    
+    if unchanged:
+        print(f"({unchanged} agents unchanged)")
 
-def simulate_agent_work(agent: Dict, tm: TaskManager, task_id: str, work_duration: int = 2):
-    """Simulate an agent working on a task."""
+def simulate_agent_work(agent: Dict, tm: TaskManager, task_id: str, work_duration: int = 2,
+                        clock: Callable[[float], None] = time.sleep,
+                        completes: Optional[bool] = None):
+    """Simulate an agent working on a task; clock stands in for the time spent working.
+    
+    completes fixes the outcome (e.g. from a pre-drawn batch); when None it is rolled here.
+    """
     print(f"🔨 {agent['name']} starting work on task {task_id}")
     
     # Start the task
@@ -86,10 +169,12 @@ def simulate_agent_work(agent: Dict, tm: TaskManager, task_id: str, work_duratio
     agent['current_workload'] += 1
     
     # Simulate work (in real scenarios, this would be actual work)
-    time.sleep(work_duration)
+    clock(work_duration)
     
     # Random chance of completion vs. partial progress
-    if random.random() < 0.7:  # 70% chance of completion
+    if completes is None:
+        completes = random.random() < 0.7  # 70% chance of completion
+    if completes:
         tm.complete_task(task_id)
         agent['current_workload'] -= 1
         agent['completed_tasks'] += 1
@@ -151,125 +236,77 @@ def create_project_tasks(tm: TaskManager):
     
     print("Creating 'E-commerce Platform' project tasks...")
     
-    # Backend tasks
-    backend_tasks = []
-    backend_tasks.append(tm.add_task(
-        "Implement user authentication API",
-        description="JWT-based authentication with refresh tokens",
-        priority="critical",
-        tags=["backend", "api", "security"]
-    ))
-    
-    backend_tasks.append(tm.add_task(
-        "Design product catalog database schema",
-        description="Optimize for product search and filtering",
-        priority="high",
-        tags=["backend", "database"]
-    ))
-    
-    backend_tasks.append(tm.add_task(
-        "Implement payment processing API",
-        description="Integrate with Stripe and PayPal",
-        priority="critical",
-        tags=["backend", "api", "payment"]
-    ))
-    
-    backend_tasks.append(tm.add_task(
-        "Add product search API with filtering",
-        depends_on=[backend_tasks[1]],  # Depends on database schema
-        priority="high",
-        tags=["backend", "api", "search"]
-    ))
-    
-    # Frontend tasks
-    frontend_tasks = []
-    frontend_tasks.append(tm.add_task(
-        "Create responsive product listing page",
-        description="Grid layout with filters and sorting",
-        priority="high",
-        tags=["frontend", "ui", "responsive"]
-    ))
-    
-    frontend_tasks.append(tm.add_task(
-        "Build shopping cart component",
-        description="Persistent cart with local storage backup",
-        priority="high",
-        tags=["frontend", "ui", "components"]
-    ))
-    
-    frontend_tasks.append(tm.add_task(
-        "Implement checkout flow UI",
-        depends_on=[frontend_tasks[1], backend_tasks[2]],  # Needs cart and payment API
-        priority="critical",
-        tags=["frontend", "ui", "checkout"]
-    ))
-    
-    frontend_tasks.append(tm.add_task(
-        "Add user authentication forms",
-        depends_on=[backend_tasks[0]],  # Needs auth API
-        priority="medium",
-        tags=["frontend", "ui", "auth"]
-    ))
-    
-    # Full-stack integration tasks
-    integration_tasks = []
-    integration_tasks.append(tm.add_task(
-        "Integrate product listing with search API",
-        depends_on=[frontend_tasks[0], backend_tasks[3]],
-        priority="high",
-        tags=["integration", "frontend", "backend"]
-    ))
-    
-    integration_tasks.append(tm.add_task(
-        "End-to-end checkout flow integration",
-        depends_on=[frontend_tasks[2]],
-        priority="critical",
-        tags=["integration", "testing"]
-    ))
-    
-    # DevOps tasks
-    devops_tasks = []
-    devops_tasks.append(tm.add_task(
-        "Set up production database cluster",
-        priority="critical",
-        tags=["devops", "infrastructure", "database"]
-    ))
-    
-    devops_tasks.append(tm.add_task(
-        "Configure CI/CD pipeline",
-        priority="high",
-        tags=["devops", "ci-cd", "automation"]
-    ))
-    
-    devops_tasks.append(tm.add_task(
-        "Set up monitoring and alerting",
-        depends_on=[devops_tasks[0]],  # Needs production environment
-        priority="medium",
-        tags=["devops", "monitoring"]
-    ))
-    
-    # QA tasks
-    qa_tasks = []
-    qa_tasks.append(tm.add_task(
-        "Write automated tests for auth API",
-        depends_on=[backend_tasks[0]],
-        priority="high",
-        tags=["qa", "testing", "api"]
-    ))
-    
-    qa_tasks.append(tm.add_task(
-        "Create UI automation tests for checkout",
-        depends_on=[integration_tasks[1]],
-        priority="high",
-        tags=["qa", "testing", "ui"]
-    ))
-    
-    qa_tasks.append(tm.add_task(
-        "Perform security testing on payment flow",
-        depends_on=[backend_tasks[2], frontend_tasks[2]],
-        priority="critical",
-        tags=["qa", "security", "testing"]
-    ))
+    # Every spec is built first and written in one transaction; depends_on
+    # entries are indexes into this list, resolved by add_many()
+    specs = [
+        # Backend tasks (0-3)
+        {'title': "Implement user authentication API",
+         'description': "JWT-based authentication with refresh tokens",
+         'priority': "critical", 'tags': ["backend", "api", "security"]},
+        {'title': "Design product catalog database schema",
+         'description': "Optimize for product search and filtering",
+         'priority': "high", 'tags': ["backend", "database"]},
+        {'title': "Implement payment processing API",
+         'description': "Integrate with Stripe and PayPal",
+         'priority': "critical", 'tags': ["backend", "api", "payment"]},
+        {'title': "Add product search API with filtering",
+         'depends_on': [1],  # Depends on database schema
+         'priority': "high", 'tags': ["backend", "api", "search"]},
+        
+        # Frontend tasks (4-7)
+        {'title': "Create responsive product listing page",
+         'description': "Grid layout with filters and sorting",
+         'priority': "high", 'tags': ["frontend", "ui", "responsive"]},
+        {'title': "Build shopping cart component",
+         'description': "Persistent cart with local storage backup",
+         'priority': "high", 'tags': ["frontend", "ui", "components"]},
+        {'title': "Implement checkout flow UI",
+         'depends_on': [5, 2],  # Needs cart and payment API
+         'priority': "critical", 'tags': ["frontend", "ui", "checkout"]},
+        {'title': "Add user authentication forms",
+         'depends_on': [0],  # Needs auth API
+         'priority': "medium", 'tags': ["frontend", "ui", "auth"]},
+        
+        # Full-stack integration tasks (8-9)
+        {'title': "Integrate product listing with search API",
+         'depends_on': [4, 3],
+         'priority': "high", 'tags': ["integration", "frontend", "backend"]},
+        {'title': "End-to-end checkout flow integration",
+         'depends_on': [6],
+         'priority': "critical", 'tags': ["integration", "testing"]},
+        
+        # DevOps tasks (10-12)
+        {'title': "Set up production database cluster",
+         'priority': "critical", 'tags': ["devops", "infrastructure", "database"]},
+        {'title': "Configure CI/CD pipeline",
+         'priority': "high", 'tags': ["devops", "ci-cd", "automation"]},
+        {'title': "Set up monitoring and alerting",
+         'depends_on': [10],  # Needs production environment
+         'priority': "medium", 'tags': ["devops", "monitoring"]},
+        
+        # QA tasks (13-15)
+        {'title': "Write automated tests for auth API",
+         'depends_on': [0],
+         'priority': "high", 'tags': ["qa", "testing", "api"]},
+        {'title': "Create UI automation tests for checkout",
+         'depends_on': [9],
+         'priority': "high", 'tags': ["qa", "testing", "ui"]},
+        {'title': "Perform security testing on payment flow",
+         'depends_on': [2, 6],
+         'priority': "critical", 'tags': ["qa", "security", "testing"]},
+    ]
+    
+    task_ids = tm.add_many([
+        {**{key: value for key, value in spec.items() if key != 'tags'},
+         'priority': _PRIORITY_ALIASES.get(spec['priority'], spec['priority'])}
+        for spec in specs
+    ])
+    _TASK_TAGS.update(zip(task_ids, (spec['tags'] for spec in specs)))
+    backend_tasks = task_ids[0:4]
+    frontend_tasks = task_ids[4:8]
+    integration_tasks = task_ids[8:10]
+    devops_tasks = task_ids[10:13]
+    qa_tasks = task_ids[13:16]
     
     all_task_ids = backend_tasks + frontend_tasks + integration_tasks + devops_tasks + qa_tasks
     
@@ -296,32 +333,59 @@ def intelligent_task_assignment(agents: Dict, tm: TaskManager):
     print("Assigning tasks based on agent specialties and current workload...")
     
     # Get all unassigned pending tasks
-    unassigned_tasks = [t for t in tm.list_tasks(status="pending") if not t['assignee']]
+    unassigned_tasks = tm.list_tasks(status="pending", unassigned=True)
+    
+    # Index agents by specialty once, so each task only scores agents that
+    # share at least one of its tags
+    specialty_to_agents = defaultdict(list)
+    for agent_id, agent in agents.items():
+        for specialty in set(agent['specialties']):
+            specialty_to_agents[specialty].append(agent_id)
+    tag_to_bit = assign_specialty_masks(agents)
+    
+    # Per-agent working state as [specialty mask, workload, capacity, order];
+    # the loop mutates these lists and the workloads are written back after
+    state = {
+        agent_id: [agent['specialty_mask'], agent['current_workload'], agent['workload_capacity'], i]
+        for i, (agent_id, agent) in enumerate(agents.items())
+    }
+    
+    def rank(agent_id, task_mask):
+        # Consider both specialty match and current workload; ties go to
+        # the agent listed first
+        specialty_mask, workload, _capacity, order = state[agent_id]
+        return ((specialty_mask & task_mask).bit_count() * 10 - workload, -order)
     
     assignments = []
+    pending_updates = []
+    # Bind the per-task lookups once outside the loop
+    candidates_for = specialty_to_agents.get
+    add_update = pending_updates.append
+    add_assignment = assignments.append
     
     for task in unassigned_tasks:
-        task_tags = set(task.get('tags', []))
+        tags = task_tags(task)
+        task_mask = tag_mask(tags, tag_to_bit)
         
         # Find agents whose specialties match task tags
-        candidate_agents = []
-        for agent_id, agent in agents.items():
-            specialty_match = len(set(agent['specialties']) & task_tags)
-            if specialty_match > 0:
-                # Consider both specialty match and current workload
-                score = specialty_match * 10 - agent['current_workload']
-                candidate_agents.append((agent_id, agent, score))
+        candidate_ids = {agent_id for tag in tags for agent_id in candidates_for(tag, ())}
         
-        if candidate_agents:
-            # Sort by score (higher is better)
-            candidate_agents.sort(key=lambda x: x[2], reverse=True)
-            best_agent_id, best_agent, score = candidate_agents[0]
+        if candidate_ids:
+            best_agent_id = max(candidate_ids, key=lambda agent_id: rank(agent_id, task_mask))
+            best_state = state[best_agent_id]
+            best_score = rank(best_agent_id, task_mask)[0]
             
             # Check if agent has capacity
-            if best_agent['current_workload'] < best_agent['workload_capacity']:
-                tm.update_task(task['id'], assignee=best_agent_id)
-                best_agent['current_workload'] += 1
-                assignments.append((task['id'], task['title'], best_agent['name'], score))
+            if best_state[1] < best_state[2]:
+                add_update((task['id'], best_agent_id))
+                best_state[1] += 1
+                add_assignment((task['id'], task['title'], agents[best_agent_id]['name'], best_score))
+    
+    for agent_id, (_specialties, workload, _capacity, _order) in state.items():
+        agents[agent_id]['current_workload'] = workload
+    
+    # Write every assignment in one transaction
+    tm.assign_many(pending_updates)
     
     print(f"✓ Assigned {len(assignments)} tasks")
     for task_id, title, agent_name, score in assignments:
@@ -329,35 +393,63 @@ def intelligent_task_assignment(agents: Dict, tm: TaskManager):
     
     return assignments
 
-def simulate_team_collaboration(agents: Dict, tm: TaskManager):
+def simulate_team_collaboration(agents: Dict, tm: TaskManager,
+                                clock: Callable[[float], None] = time.sleep,
+                                seed: Optional[int] = None, cycles: int = 3):
     """Simulate agents working collaboratively on tasks."""
     print_separator("Team Collaboration Simulation")
     
     print("Simulating collaborative development work...")
     
+    # Only agents who worked in a cycle can have changed; last_state
+    # suppresses reprinting agents whose counts came out the same
+    last_state = {}
+    
+    # Draw every task pick and completion roll for the run up front
+    rng = random.Random(seed)
+    draws = cycles * len(agents)
+    pick_rolls = iter([rng.random() for _ in range(draws)])
+    completion_rolls = iter([rng.random() < 0.7 for _ in range(draws)])
+    
     # Simulate multiple work cycles
-    for cycle in range(1, 4):
+    for cycle in range(1, cycles + 1):
         print(f"\n🔄 Work Cycle {cycle}")
         print("-" * 30)
         
-        # Each agent works on their assigned tasks
+        # Each agent works on their assigned tasks; agents only touch their
+        # own tasks, so one snapshot per cycle serves every agent
+        pending_by_agent = bucket_by_assignee(tm.list_tasks(status="pending"))
+        work = []
         for agent_id, agent in agents.items():
-            assigned_tasks = tm.list_tasks(assignee=agent_id, status="pending")
-            
+            pick, completes = next(pick_rolls), next(completion_rolls)
+            assigned_tasks = pending_by_agent[agent_id]['pending']
             if assigned_tasks:
                 # Pick a random task to work on
-                task = random.choice(assigned_tasks)
-                simulate_agent_work(agent, tm, task['id'], work_duration=1)
-            
-            # Check for notifications
-            notifications = tm.check_notifications()
+                task = assigned_tasks[int(pick * len(assigned_tasks))]
+                work.append((agent, task, completes))
+        
+        # Agents work concurrently on disjoint tasks, so their simulated
+        # work periods overlap instead of running back to back
+        if work:
+            with ThreadPoolExecutor(max_workers=len(work)) as pool:
+                list(pool.map(
+                    lambda item: simulate_agent_work(item[0], tm, item[1]['id'], work_duration=1,
+                                                     clock=clock, completes=item[2]),
+                    work
+                ))
+        
+        # Check every agent's notifications with one query
+        notifications_by_agent = tm.watch_many(list(agents))
+        for agent_id, agent in agents.items():
+            notifications = notifications_by_agent[agent_id]
             if notifications:
                 print(f"📬 {agent['name']} has {len(notifications)} notifications")
                 for notif in notifications[:2]:  # Show first 2
                     print(f"    [{notif['type']}] {notif['message']}")
         
-        print_team_status(agents, tm)
-        time.sleep(1)
+        dirty = {agent['id'] for agent, _task, _completes in work}
+        print_team_status(agents, tm, dirty=dirty if cycle > 1 else None, last_state=last_state)
+        clock(1)
 
 def demonstrate_conflict_detection(agents: Dict, tm: TaskManager):
     """Demonstrate conflict detection when multiple agents work on related tasks."""
@@ -441,7 +533,6 @@ def demonstrate_cross_team_coordination(agents: Dict, tm: TaskManager):
         priority="high",
         tags=["backend", "api", "websocket"]
     )
-    tm.update_task(websocket_api, assignee="alice_backend")
     
     # Frontend work
     notification_ui = tm.add_task(
@@ -450,7 +541,6 @@ def demonstrate_cross_team_coordination(agents: Dict, tm: TaskManager):
         priority="medium",
         tags=["frontend", "ui", "components"]
     )
-    tm.update_task(notification_ui, assignee="bob_frontend")
     
     # Integration work
     integration_task = tm.add_task(
@@ -459,7 +549,6 @@ def demonstrate_cross_team_coordination(agents: Dict, tm: TaskManager):
         priority="high",
         tags=["integration", "real-time"]
     )
-    tm.update_task(integration_task, assignee="charlie_fullstack")
     
     # Infrastructure work
     infra_task = tm.add_task(
@@ -468,7 +557,6 @@ def demonstrate_cross_team_coordination(agents: Dict, tm: TaskManager):
         priority="medium",
         tags=["devops", "infrastructure", "scalability"]
     )
-    tm.update_task(infra_task, assignee="diana_devops")
     
     # QA work
     testing_task = tm.add_task(
@@ -477,7 +565,15 @@ def demonstrate_cross_team_coordination(agents: Dict, tm: TaskManager):
         priority="high",
         tags=["qa", "testing", "real-time"]
     )
-    tm.update_task(testing_task, assignee="eve_qa")
+    
+    # Hand each piece to its team in one transaction
+    tm.assign_many([
+        (websocket_api, "alice_backend"),
+        (notification_ui, "bob_frontend"),
+        (integration_task, "charlie_fullstack"),
+        (infra_task, "diana_devops"),
+        (testing_task, "eve_qa"),
+    ])
     
     print("✓ Cross-team feature created:")
     print("  👤 Alice (Backend): WebSocket API")
@@ -512,6 +608,7 @@ def demonstrate_workload_balancing(agents: Dict, tm: TaskManager):
     
     if overloaded_agents and underutilized_agents:
         print("\n⚖️  Workload rebalancing opportunities found:")
+        tag_to_bit = assign_specialty_masks(agents)
         
         for overloaded_id, overloaded_agent in overloaded_agents:
             print(f"  Overloaded: {overloaded_agent['name']} ({overloaded_agent['current_workload']}/{overloaded_agent['workload_capacity']})")
@@ -520,12 +617,11 @@ def demonstrate_workload_balancing(agents: Dict, tm: TaskManager):
             overloaded_tasks = tm.list_tasks(assignee=overloaded_id, status="pending")
             
             for task in overloaded_tasks[:2]:  # Consider first 2 tasks
-                task_tags = set(task.get('tags', []))
+                task_mask = tag_mask(task_tags(task), tag_to_bit)
                 
                 # Find underutilized agents who could take this task
                 for underutil_id, underutil_agent in underutilized_agents:
-                    agent_specialties = set(underutil_agent['specialties'])
-                    if task_tags & agent_specialties:  # Has relevant expertise
+                    if task_mask & underutil_agent['specialty_mask']:  # Has relevant expertise
                         print(f"    Could reassign [{task['id']}] {task['title']}")
                         print(f"      From: {overloaded_agent['name']} → To: {underutil_agent['name']}")
                         
@@ -543,16 +639,25 @@ def generate_team_report(agents: Dict, tm: TaskManager):
     """Generate a comprehensive team productivity report."""
     print_separator("Team Productivity Report")
     
-    print(f"📊 Team Report - Generated {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"📊 Team Report - Generated {datetime.now().isoformat(sep=' ', timespec='seconds')}")
     print("=" * 60)
     
     # Overall statistics
     all_tasks = tm.list_tasks()
     total_tasks = len(all_tasks)
-    completed_tasks = len([t for t in all_tasks if t['status'] == 'completed'])
-    in_progress_tasks = len([t for t in all_tasks if t['status'] == 'in_progress'])
-    pending_tasks = len([t for t in all_tasks if t['status'] == 'pending'])
-    blocked_tasks = len([t for t in all_tasks if t['status'] == 'blocked'])
+    
+    # Status totals are grouped in SQL; one pass buckets the rows for the rest
+    status_counts = Counter(tm.count_by_status())
+    by_assignee = defaultdict(list)
+    blocked_tasks_detail = []
+    for task in all_tasks:
+        by_assignee[task['assignee']].append(task)
+        if task['status'] == 'blocked':
+            blocked_tasks_detail.append(task)
+    completed_tasks = status_counts['completed']
+    in_progress_tasks = status_counts['in_progress']
+    pending_tasks = status_counts['pending']
+    blocked_tasks = status_counts['blocked']
     
     print(f"\n📈 Overall Progress:")
     print(f"  Total Tasks: {total_tasks}")
@@ -564,9 +669,10 @@ def generate_team_report(agents: Dict, tm: TaskManager):
     # Agent performance
     print(f"\n👥 Individual Performance:")
     for agent_id, agent in agents.items():
-        agent_tasks = tm.list_tasks(assignee=agent_id)
-        completed_count = len([t for t in agent_tasks if t['status'] == 'completed'])
-        active_count = len([t for t in agent_tasks if t['status'] == 'in_progress'])
+        agent_tasks = by_assignee.get(agent_id, [])
+        agent_statuses = Counter(t['status'] for t in agent_tasks)
+        completed_count = agent_statuses['completed']
+        active_count = agent_statuses['in_progress']
         
         efficiency = completed_count / max(len(agent_tasks), 1) * 100
         
@@ -577,7 +683,6 @@ def generate_team_report(agents: Dict, tm: TaskManager):
     
     # Bottleneck analysis
     print(f"\n🚧 Bottleneck Analysis:")
-    blocked_tasks_detail = [t for t in all_tasks if t['status'] == 'blocked']
     if blocked_tasks_detail:
         print(f"  {len(blocked_tasks_detail)} tasks are currently blocked:")
         for task in blocked_tasks_detail[:5]:  # Show top 5
@@ -618,8 +723,9 @@ def main():
         # Demonstrate intelligent assignment
         intelligent_task_assignment(agents, tm)
         
-        # Simulate team collaboration
-        simulate_team_collaboration(agents, tm)
+        # Simulate team collaboration (DEMO_FAST=1 skips the simulated waits)
+        clock = (lambda _seconds: None) if os.environ.get('DEMO_FAST') else time.sleep
+        simulate_team_collaboration(agents, tm, clock=clock)
         
         # Show conflict detection
         demonstrate_conflict_detection(agents, tm)
@@ -8,22 +8,170 @@ Implements agent workload distribution, performance metrics, and communication c
 @implements FR-020: Agent Communication Channels
 """
 
+import atexit
 import sqlite3
 import json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
 import os
 
+try:
+    import orjson  # Optional fast JSON codec
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Buffered heartbeats are written once this many are pending or the oldest
+# has waited this long (seconds)
+_HEARTBEAT_FLUSH_SIZE = 64
+_HEARTBEAT_FLUSH_INTERVAL = 0.5
+
+# Buffered metrics are written once this many are pending or the oldest
+# has waited this long (seconds)
+_METRIC_FLUSH_SIZE = 64
+_METRIC_FLUSH_INTERVAL = 0.2
+
+# calculate_agent_load reuses a load score computed within this many seconds
+_LOAD_TTL = 0.5
+
+# JSON codec for capabilities and history metadata: orjson when installed,
+# otherwise a reused stdlib encoder/decoder (both emit compact JSON)
+if orjson is not None:
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.JSONEncoder(separators=(',', ':')).encode
+    _json_loads = json.JSONDecoder().decode
+
+
+@lru_cache(maxsize=1024)
+def _parse_capabilities(raw: str) -> tuple:
+    """Decode a capabilities column once per distinct value"""
+    return tuple(_json_loads(raw))
+
+
+def _decode_capabilities(raw: Optional[str]) -> List[str]:
+    """Capabilities as a fresh list; agents mostly share a few distinct lists"""
+    return list(_parse_capabilities(raw or '[]'))
+
+
+# Composite indexes for the history and metrics filters; created
+# idempotently on open. Migration 005 owns the agents, workload,
+# capability and inbox indexes. The tasks table belongs to TaskManager,
+# which creates idx_tasks_assignee_status; the completed-task index is
+# only added here, once that table exists.
+_AGENT_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_hist_agent_action_ts "
+    "ON agent_task_history(agent_id, action, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_metrics_agent_type_time "
+    "ON agent_metrics(agent_id, metric_type, recorded_at)",
+    "CREATE INDEX IF NOT EXISTS idx_metrics_agent_time "
+    "ON agent_metrics(agent_id, recorded_at)",
+)
+_TASK_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_tasks_assignee_completed_date "
+    "ON tasks(assignee, status, updated_at) WHERE status = 'completed'",
+)
+
+# get_agent_metrics time_range -> window length in days (default daily)
+_METRIC_WINDOW_DAYS = {'daily': 1, 'weekly': 7, 'monthly': 30}
+
+# Bound parameters per IN (...) list; stays under SQLite's historical
+# 999-variable limit
+_MAX_SQL_VARIABLES = 500
+
+# Columns of the agents table, in the order discover_agents selects them
+_AGENT_FIELDS = ('id', 'name', 'type', 'capabilities', 'status',
+                 'last_heartbeat', 'registered_at', 'metadata')
+_SQL_SELECT_AGENTS = f"SELECT {', '.join(_AGENT_FIELDS)} FROM agents"
+
+# Least loaded active agent, overall or among those with every one of N
+# capabilities; the capability variant's text depends only on N. Every
+# agent has a workload row with a non-NULL score, so both are plain joins
+# the planner can serve from idx_agents_status_id / idx_agent_workload_load.
+_SQL_LEAST_LOADED = """
+    SELECT w.agent_id as id, w.current_load_score as load_score
+    FROM agent_workload w
+    JOIN agents a ON a.id = w.agent_id
+    WHERE a.status = 'active'
+    ORDER BY w.current_load_score ASC
+    LIMIT 1
+"""
+
+
+@lru_cache(maxsize=16)
+def _least_loaded_sql(capability_count: int) -> str:
+    """SQL for find_least_loaded_agent with capability_count capabilities"""
+    placeholders = ','.join('?' * capability_count)
+    return f"""
+        SELECT a.id, w.current_load_score as load_score
+        FROM agents a
+        JOIN agent_capabilities c ON c.agent_id = a.id
+        JOIN agent_workload w ON a.id = w.agent_id
+        WHERE a.status = 'active' AND c.capability IN ({placeholders})
+        GROUP BY a.id
+        HAVING COUNT(DISTINCT c.capability) = ?
+        ORDER BY load_score ASC
+        LIMIT 1
+    """
+
+
+# Active agents with a workload row, as candidates for redistribute_tasks
+_SQL_ACTIVE_AGENTS = """
+    SELECT a.id
+    FROM agents a
+    JOIN agent_workload w ON a.id = w.agent_id
+    WHERE a.status = 'active'
+"""
+
+
+@lru_cache(maxsize=16)
+def _capable_agents_sql(capability_count: int) -> str:
+    """SQL for the active agents having all of capability_count capabilities"""
+    placeholders = ','.join('?' * capability_count)
+    return f"""
+        SELECT a.id
+        FROM agents a
+        JOIN agent_capabilities c ON c.agent_id = a.id
+        JOIN agent_workload w ON a.id = w.agent_id
+        WHERE a.status = 'active' AND c.capability IN ({placeholders})
+        GROUP BY a.id
+        HAVING COUNT(DISTINCT c.capability) = ?
+    """
+
+
+# Hot statements, kept as constants so every call hits the connection's
+# statement cache with the same text
+_STATEMENT_CACHE_SIZE = 256
+_SQL_AGENT_EXISTS = "SELECT 1 FROM agents WHERE id = ?"
+_SQL_WRITE_HEARTBEAT = "UPDATE agents SET last_heartbeat = ? WHERE id = ?"
+_SQL_SET_STATUS = "UPDATE agents SET status = ? WHERE id = ?"
+_SQL_RECORD_METRIC = """
+    INSERT INTO agent_metrics
+    (agent_id, metric_type, metric_value, task_id, recorded_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 class AgentManager:
     """
     Manages agent registration, workload distribution, performance metrics,
     and inter-agent communication for the Task Orchestrator system.
+    
+    Heartbeats and metrics are buffered. A background thread, started with
+    the first buffered row, writes each buffer on its own connection once
+    its oldest row is _HEARTBEAT_FLUSH_INTERVAL / _METRIC_FLUSH_INTERVAL
+    seconds old, and anything still pending is flushed at interpreter exit.
+    Leaving the context manager (or calling flush_heartbeats() /
+    flush_metrics()) writes the buffers immediately.
     """
     
     def __init__(self, db_path: str = None):
@@ -40,15 +188,66 @@ class AgentManager:
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database connection
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # One connection per thread (see the conn property); WAL lets
+        # readers on one thread run alongside a writer on another
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._conn_lock = threading.Lock()
+        
+        # Pending heartbeats: agent_id -> UTC timestamp, written in batches
+        self._hb_buffer: Dict[str, str] = {}
+        self._hb_lock = threading.Lock()
+        self._hb_oldest = None
+        
+        # Pending metric rows, written in batches
+        self._metric_buffer: List[Tuple] = []
+        self._metric_lock = threading.Lock()
+        self._metric_oldest = None
+        
+        # Background flusher for both buffers, started with the first row
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        
+        # agent_id -> (load_score, monotonic time it was computed)
+        self._load_cache: Dict[str, Tuple[float, float]] = {}
         
         # Ensure tables exist
         self._ensure_tables_exist()
         
         logger.info(f"AgentManager initialized with database: {db_path}")
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened and tuned on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # check_same_thread=False only so __exit__ can close every
+            # thread's connection; each is otherwise used by its own thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=_STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+            with self._conn_lock:
+                self._connections.append(conn)
+            self._local.conn = conn
+        return conn
+    
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """
+        Tune the connection for many small commits (heartbeats, metrics, messages)
+        
+        WAL turns each commit into a log append and lets readers run
+        alongside the writer; journal_mode persists in the database file,
+        the other PRAGMAs apply to this connection only.
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+    
     def _ensure_tables_exist(self):
         """Ensure all required tables exist by running migration if needed"""
         cursor = self.conn.cursor()
@@ -75,15 +274,152 @@ class AgentManager:
             spec.loader.exec_module(migration)
             migration.migrate_up(self.conn)
             logger.info("Agent management tables created")
+        else:
+            self._ensure_capability_table()
+            self._ensure_priority_rank()
+            self._ensure_workload_rows()
+            self._ensure_inbox_table()
+        
+        self._ensure_indexes()
+    
+    def _ensure_priority_rank(self):
+        """Add the generated priority_rank column to older agent_messages tables"""
+        columns = {row['name'] for row in
+                   self.conn.execute("PRAGMA table_xinfo(agent_messages)")}
+        if 'priority_rank' in columns:
+            return
+        
+        # ALTER TABLE only accepts VIRTUAL generated columns
+        self.conn.execute("""
+            ALTER TABLE agent_messages ADD COLUMN priority_rank INTEGER
+            GENERATED ALWAYS AS (
+                CASE priority WHEN 'critical' THEN 0 WHEN 'high' THEN 1
+                              WHEN 'normal' THEN 2 ELSE 3 END
+            ) VIRTUAL
+        """)
+        self.conn.execute("DROP INDEX IF EXISTS idx_msgs_to_status_prio")
+        self.conn.commit()
+    
+    def _ensure_inbox_table(self):
+        """Create agent_message_inbox on older databases and fill it from agent_messages"""
+        if self.conn.execute("""
+            SELECT 1 FROM sqlite_master 
+            WHERE type='table' AND name='agent_message_inbox'
+        """).fetchone():
+            return
+        
+        self.conn.execute("""
+            CREATE TABLE agent_message_inbox (
+                agent_id TEXT NOT NULL,
+                message_id INTEGER NOT NULL,
+                status TEXT DEFAULT 'unread',
+                read_at TIMESTAMP,
+                PRIMARY KEY (agent_id, message_id),
+                FOREIGN KEY (agent_id) REFERENCES agents(id),
+                FOREIGN KEY (message_id) REFERENCES agent_messages(id)
+            )
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agent_message_inbox_status
+            ON agent_message_inbox(agent_id, status)
+        """)
+        # Direct messages keep their recipient's state; a broadcast's single
+        # shared state is copied to every agent
+        self.conn.execute("""
+            INSERT OR IGNORE INTO agent_message_inbox (agent_id, message_id, status, read_at)
+            SELECT to_agent, id, status, read_at FROM agent_messages
+            WHERE to_agent IS NOT NULL
+        """)
+        self.conn.execute("""
+            INSERT OR IGNORE INTO agent_message_inbox (agent_id, message_id, status, read_at)
+            SELECT a.id, m.id, m.status, m.read_at
+            FROM agent_messages m, agents a
+            WHERE m.to_agent IS NULL AND m.message_type = 'broadcast'
+        """)
+        self.conn.execute("DROP INDEX IF EXISTS idx_msgs_recv")
+        self.conn.commit()
+        logger.info("Agent message inbox created")
+    
+    def _ensure_workload_rows(self):
+        """Give every agent a workload row with a non-NULL load score"""
+        self.conn.execute("""
+            UPDATE agent_workload SET current_load_score = 0
+            WHERE current_load_score IS NULL
+        """)
+        self.conn.execute("""
+            INSERT OR IGNORE INTO agent_workload (agent_id, current_load_score)
+            SELECT id, 0 FROM agents
+        """)
+        self.conn.commit()
+    
+    def _ensure_indexes(self):
+        """Create the composite indexes behind the hot WHERE clauses"""
+        statements = list(_AGENT_INDEXES)
+        if self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='tasks'").fetchone():
+            statements.extend(_TASK_INDEXES)
+        for statement in statements:
+            self.conn.execute(statement)
+        self.conn.commit()
+    
+    def _ensure_capability_table(self):
+        """Add agent_capabilities to databases migrated before it existed"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='agent_capabilities'
+        """)
+        if cursor.fetchone():
+            return
+        
+        cursor.execute("""
+            CREATE TABLE agent_capabilities (
+                agent_id TEXT NOT NULL,
+                capability TEXT NOT NULL,
+                PRIMARY KEY (agent_id, capability),
+                FOREIGN KEY (agent_id) REFERENCES agents(id)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agent_capabilities_capability
+            ON agent_capabilities(capability, agent_id)
+        """)
+        
+        # Backfill from the JSON column
+        cursor.execute("SELECT id, capabilities FROM agents")
+        rows = [(row['id'], capability)
+                for row in cursor.fetchall()
+                for capability in _decode_capabilities(row['capabilities'])]
+        cursor.executemany("""
+            INSERT OR IGNORE INTO agent_capabilities (agent_id, capability)
+            VALUES (?, ?)
+        """, rows)
+        self.conn.commit()
+        logger.info("Agent capability index created")
     
     def __enter__(self):
         """Context manager entry"""
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Context manager exit - checkpoint the WAL and close every thread's connection"""
+        self._stop_flusher()
+        if not self._connections:
+            return
+        
+        self.flush_heartbeats()
+        self.flush_metrics()
+        try:
+            # Fold the WAL back into the database so it does not grow unbounded
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+        
+        with self._conn_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
     
     # ========== Agent Registration & Discovery (Foundation) ==========
     
@@ -105,22 +441,37 @@ class AgentManager:
             cursor = self.conn.cursor()
             
             # Convert capabilities to JSON
-            capabilities_json = json.dumps(capabilities) if capabilities else '[]'
+            capabilities_json = _json_dumps(capabilities) if capabilities else '[]'
             
-            # Insert or update agent
+            # Insert or update agent in place, keeping registered_at and the
+            # rowid of an existing registration
             cursor.execute("""
-                INSERT OR REPLACE INTO agents 
+                INSERT INTO agents 
                 (id, name, type, capabilities, status, last_heartbeat, registered_at)
                 VALUES (?, ?, ?, ?, 'active', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    type = excluded.type,
+                    capabilities = excluded.capabilities,
+                    status = 'active',
+                    last_heartbeat = CURRENT_TIMESTAMP
             """, (agent_id, name, agent_type, capabilities_json))
             
+            # Keep the normalized capability rows in step with the JSON column
+            cursor.execute("DELETE FROM agent_capabilities WHERE agent_id = ?", (agent_id,))
+            cursor.executemany("""
+                INSERT OR IGNORE INTO agent_capabilities (agent_id, capability)
+                VALUES (?, ?)
+            """, [(agent_id, capability) for capability in capabilities or []])
+            
             # Initialize workload entry
             cursor.execute("""
-                INSERT OR IGNORE INTO agent_workload (agent_id)
-                VALUES (?)
+                INSERT OR IGNORE INTO agent_workload (agent_id, current_load_score)
+                VALUES (?, 0)
             """, (agent_id,))
             
             self.conn.commit()
+            self._load_cache.pop(agent_id, None)
             logger.info(f"Agent registered: {agent_id} ({name})")
             return True
             
@@ -141,9 +492,12 @@ class AgentManager:
             List of agent dictionaries
         """
         try:
+            # Plain tuples zipped against a fixed column list are cheaper to
+            # turn into dicts than sqlite3.Row
             cursor = self.conn.cursor()
+            cursor.row_factory = None
             
-            query = "SELECT * FROM agents WHERE 1=1"
+            query = _SQL_SELECT_AGENTS + " WHERE 1=1"
             params = []
             
             if status:
@@ -156,10 +510,16 @@ class AgentManager:
             
             cursor.execute(query, params)
             
+            # Snapshot buffered heartbeats once rather than locking per row
+            with self._hb_lock:
+                pending = dict(self._hb_buffer)
+            
             agents = []
-            for row in cursor.fetchall():
-                agent = dict(row)
-                agent['capabilities'] = json.loads(agent.get('capabilities', '[]'))
+            for row in cursor:
+                agent = dict(zip(_AGENT_FIELDS, row))
+                agent['capabilities'] = _decode_capabilities(agent['capabilities'])
+                if agent['id'] in pending:
+                    agent['last_heartbeat'] = pending[agent['id']]
                 agents.append(agent)
             
             return agents
@@ -185,8 +545,8 @@ class AgentManager:
             row = cursor.fetchone()
             if row:
                 agent = dict(row)
-                agent['capabilities'] = json.loads(agent.get('capabilities', '[]'))
-                return agent
+                agent['capabilities'] = _decode_capabilities(agent['capabilities'])
+                return self._overlay_heartbeat(agent)
             
             return None
             
@@ -198,27 +558,135 @@ class AgentManager:
         """
         Update agent heartbeat timestamp
         
+        The timestamp is buffered and written with other pending heartbeats
+        in one transaction (see flush_heartbeats), so frequent heartbeats do
+        not each pay for a commit.
+        
         Args:
             agent_id: Agent identifier
         
         Returns:
-            True if update successful
+            True if the agent exists and its heartbeat was recorded
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE agents 
-                SET last_heartbeat = CURRENT_TIMESTAMP 
-                WHERE id = ?
-            """, (agent_id,))
-            
-            self.conn.commit()
-            return cursor.rowcount > 0
+            if not self.conn.execute(_SQL_AGENT_EXISTS, (agent_id,)).fetchone():
+                return False
+            
+            # Same text format as SQLite's CURRENT_TIMESTAMP (UTC)
+            timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            with self._hb_lock:
+                self._hb_buffer[agent_id] = timestamp
+                if self._hb_oldest is None:
+                    self._hb_oldest = time.monotonic()
+                due = (len(self._hb_buffer) >= _HEARTBEAT_FLUSH_SIZE or
+                       time.monotonic() - self._hb_oldest >= _HEARTBEAT_FLUSH_INTERVAL)
+            
+            if due:
+                self.flush_heartbeats()
+            else:
+                self._ensure_flusher()
+            return True
             
         except Exception as e:
             logger.error(f"Failed to update heartbeat for {agent_id}: {e}")
             return False
     
+    def flush_heartbeats(self) -> int:
+        """
+        Write all buffered heartbeats in a single transaction
+        
+        Returns:
+            Number of heartbeats written
+        """
+        with self._hb_lock:
+            pending = self._hb_buffer
+            self._hb_buffer = {}
+            self._hb_oldest = None
+        if not pending:
+            return 0
+        
+        try:
+            self.conn.executemany(
+                _SQL_WRITE_HEARTBEAT,
+                [(timestamp, agent_id) for agent_id, timestamp in pending.items()]
+            )
+            self.conn.commit()
+            return len(pending)
+            
+        except Exception as e:
+            logger.error(f"Failed to flush heartbeats: {e}")
+            self.conn.rollback()
+            # Put them back unless a newer heartbeat arrived meanwhile
+            with self._hb_lock:
+                for agent_id, timestamp in pending.items():
+                    self._hb_buffer.setdefault(agent_id, timestamp)
+                if self._hb_oldest is None:
+                    self._hb_oldest = time.monotonic()
+            return 0
+    
+    def _ensure_flusher(self):
+        """Start the background flush thread and the exit-time flush, once"""
+        with self._flush_lock:
+            if self._flush_thread is not None:
+                return
+            self._flush_stop = threading.Event()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                args=(self._flush_stop, _HEARTBEAT_FLUSH_INTERVAL, _METRIC_FLUSH_INTERVAL),
+                name="agent-manager-flush", daemon=True,
+            )
+            self._flush_thread.start()
+        atexit.register(self._flush_at_exit)
+    
+    def _flush_loop(self, stop: threading.Event, heartbeat_interval: float,
+                    metric_interval: float):
+        """
+        Write each buffer once its oldest row has waited its interval
+        
+        Without this, the last heartbeats or metrics of an agent that goes
+        quiet would wait in memory for the next call. The thread writes
+        through its own connection (see the conn property).
+        """
+        while not stop.wait(min(heartbeat_interval, metric_interval)):
+            now = time.monotonic()
+            with self._hb_lock:
+                heartbeats_due = self._hb_oldest is not None and now - self._hb_oldest >= heartbeat_interval
+            with self._metric_lock:
+                metrics_due = self._metric_oldest is not None and now - self._metric_oldest >= metric_interval
+            if heartbeats_due:
+                self.flush_heartbeats()
+            if metrics_due:
+                self.flush_metrics()
+    
+    def _halt_flusher(self):
+        """Stop and join the background flush thread, if running"""
+        with self._flush_lock:
+            thread, self._flush_thread = self._flush_thread, None
+        if thread is not None:
+            self._flush_stop.set()
+            thread.join()
+        return thread is not None
+    
+    def _stop_flusher(self):
+        """Stop the background flush thread and drop the exit-time flush"""
+        if self._halt_flusher():
+            atexit.unregister(self._flush_at_exit)
+    
+    def _flush_at_exit(self):
+        """Write whatever is still buffered when the interpreter exits"""
+        self._halt_flusher()
+        if self._connections:
+            self.flush_heartbeats()
+            self.flush_metrics()
+    
+    def _overlay_heartbeat(self, agent: Dict) -> Dict:
+        """Show a buffered heartbeat that has not been written yet"""
+        with self._hb_lock:
+            timestamp = self._hb_buffer.get(agent['id'])
+        if timestamp:
+            agent['last_heartbeat'] = timestamp
+        return agent
+    
     def set_agent_status(self, agent_id: str, status: str) -> bool:
         """
         Update agent status
@@ -231,15 +699,9 @@ class AgentManager:
             True if update successful
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE agents 
-                SET status = ? 
-                WHERE id = ?
-            """, (status, agent_id))
-            
-            self.conn.commit()
-            return cursor.rowcount > 0
+            with self.conn:
+                updated = self.conn.execute(_SQL_SET_STATUS, (status, agent_id)).rowcount
+            return updated > 0
             
         except Exception as e:
             logger.error(f"Failed to update status for {agent_id}: {e}")
@@ -262,40 +724,31 @@ class AgentManager:
         try:
             cursor = self.conn.cursor()
             
-            # Count active tasks assigned to this agent
+            # Active tasks, today's completions and the 7-day average
+            # completion time in one statement, binding agent_id once
             cursor.execute("""
-                SELECT COUNT(*) as task_count,
-                       SUM(COALESCE(estimated_hours, 1)) as total_hours
-                FROM tasks 
-                WHERE assignee = ? AND status IN ('pending', 'in_progress')
+                WITH target(agent_id) AS (SELECT ?)
+                SELECT
+                    COALESCE(SUM(CASE WHEN t.status IN ('pending', 'in_progress')
+                                      THEN 1 ELSE 0 END), 0) as task_count,
+                    COALESCE(SUM(CASE WHEN t.status IN ('pending', 'in_progress')
+                                      THEN COALESCE(t.estimated_hours, 1) ELSE 0 END), 0) as total_hours,
+                    COALESCE(SUM(CASE WHEN t.status = 'completed'
+                                      AND DATE(t.updated_at) = DATE('now')
+                                      THEN 1 ELSE 0 END), 0) as completed_today,
+                    (SELECT AVG(h.duration_minutes)
+                     FROM agent_task_history h, target
+                     WHERE h.agent_id = target.agent_id AND h.action = 'completed'
+                     AND h.timestamp > datetime('now', '-7 days')) as avg_time
+                FROM target
+                LEFT JOIN tasks t ON t.assignee = target.agent_id
             """, (agent_id,))
             
             result = cursor.fetchone()
-            task_count = result['task_count'] if result else 0
-            total_hours = result['total_hours'] if result and result['total_hours'] else 0
-            
-            # Count completed tasks today
-            cursor.execute("""
-                SELECT COUNT(*) as completed_today
-                FROM tasks
-                WHERE assignee = ? 
-                AND status = 'completed'
-                AND DATE(updated_at) = DATE('now')
-            """, (agent_id,))
-            
-            completed = cursor.fetchone()
-            completed_today = completed['completed_today'] if completed else 0
-            
-            # Calculate average completion time
-            cursor.execute("""
-                SELECT AVG(duration_minutes) as avg_time
-                FROM agent_task_history
-                WHERE agent_id = ? AND action = 'completed'
-                AND timestamp > datetime('now', '-7 days')
-            """, (agent_id,))
-            
-            avg_result = cursor.fetchone()
-            avg_completion_time = avg_result['avg_time'] if avg_result and avg_result['avg_time'] else 0
+            task_count = result['task_count']
+            total_hours = result['total_hours']
+            completed_today = result['completed_today']
+            avg_completion_time = result['avg_time'] or 0
             
             # Calculate load score (0-100)
             # Formula: (task_count * 10) + (total_hours * 5) - (completed_today * 5)
@@ -311,6 +764,7 @@ class AgentManager:
                   avg_completion_time, load_score))
             
             self.conn.commit()
+            self._load_cache[agent_id] = (load_score, time.monotonic())
             
             return {
                 'agent_id': agent_id,
@@ -334,9 +788,16 @@ class AgentManager:
         Args:
             agent_id: Agent identifier
         
+        A score computed by track_workload less than _LOAD_TTL seconds ago
+        is returned without touching the database.
+        
         Returns:
             Load score (0-100, where 0 is no load, 100 is overloaded)
         """
+        cached = self._load_cache.get(agent_id)
+        if cached and time.monotonic() - cached[1] < _LOAD_TTL:
+            return cached[0]
+        
         workload = self.track_workload(agent_id)
         return workload.get('load_score', 0) if workload else 0
     
@@ -353,36 +814,14 @@ class AgentManager:
             Agent ID of the least loaded agent, or None if no suitable agent found
         """
         try:
-            cursor = self.conn.cursor()
-            
-            # Build query based on capabilities filter
             if capabilities:
-                # Find agents that have all required capabilities
-                capability_conditions = []
-                for cap in capabilities:
-                    capability_conditions.append(f"a.capabilities LIKE '%\"{cap}\"%'")
-                
-                capability_filter = " AND ".join(capability_conditions)
-                
-                query = f"""
-                    SELECT a.id, COALESCE(w.current_load_score, 0) as load_score
-                    FROM agents a
-                    LEFT JOIN agent_workload w ON a.id = w.agent_id
-                    WHERE a.status = 'active' AND ({capability_filter})
-                    ORDER BY load_score ASC
-                    LIMIT 1
-                """
+                # Agents having every required capability, via the
+                # (capability, agent_id) index
+                required = list(dict.fromkeys(capabilities))
+                cursor = self.conn.execute(_least_loaded_sql(len(required)),
+                                           required + [len(required)])
             else:
-                query = """
-                    SELECT a.id, COALESCE(w.current_load_score, 0) as load_score
-                    FROM agents a
-                    LEFT JOIN agent_workload w ON a.id = w.agent_id
-                    WHERE a.status = 'active'
-                    ORDER BY load_score ASC
-                    LIMIT 1
-                """
-            
-            cursor.execute(query)
+                cursor = self.conn.execute(_SQL_LEAST_LOADED)
             result = cursor.fetchone()
             
             if result:
@@ -408,77 +847,123 @@ class AgentManager:
             Number of tasks redistributed
         """
         try:
-            cursor = self.conn.cursor()
             redistributed = 0
+            updates = []
+            history = []
+            # agent_id -> [tasks gained, hours gained] (negative when losing)
+            moved_work: Dict[str, List[float]] = {}
             
-            # Find overloaded agents
-            cursor.execute("""
-                SELECT agent_id, current_load_score
-                FROM agent_workload
-                WHERE current_load_score > ?
-                ORDER BY current_load_score DESC
-            """, (overload_threshold,))
-            
-            overloaded_agents = cursor.fetchall()
-            
-            for agent_row in overloaded_agents:
-                agent_id = agent_row['agent_id']
+            with self.conn:
+                cursor = self.conn.cursor()
+                
+                # Unclamped load per agent from the stored workload, adjusted
+                # in memory as tasks move (same weights as track_workload)
+                cursor.execute("""
+                    SELECT agent_id,
+                           task_count * 10 + estimated_hours * 5 - completed_today * 5 as raw_load
+                    FROM agent_workload
+                """)
+                raw_load = {row['agent_id']: row['raw_load'] or 0 for row in cursor.fetchall()}
                 
-                # Get agent's capabilities
-                agent = self.get_agent(agent_id)
-                if not agent:
-                    continue
+                def current_load(agent_id: str) -> float:
+                    return min(100, max(0, raw_load.get(agent_id, 0)))
                 
-                capabilities = agent.get('capabilities', [])
+                # Eligible targets per capability set, fetched once; the
+                # least loaded is then picked from the in-memory loads
+                capable: Dict[tuple, List[str]] = {}
                 
-                # Find tasks that can be redistributed (pending tasks only)
+                def capable_agents(capabilities: List[str]) -> List[str]:
+                    required = tuple(dict.fromkeys(capabilities or ()))
+                    if required not in capable:
+                        if required:
+                            rows = self.conn.execute(_capable_agents_sql(len(required)),
+                                                     required + (len(required),))
+                        else:
+                            rows = self.conn.execute(_SQL_ACTIVE_AGENTS)
+                        capable[required] = [row[0] for row in rows]
+                    return capable[required]
+                
+                # Find overloaded agents, with their capabilities
                 cursor.execute("""
-                    SELECT id, title, estimated_hours
-                    FROM tasks
-                    WHERE assignee = ? AND status = 'pending'
-                    ORDER BY priority ASC, created_at DESC
-                    LIMIT 5
-                """, (agent_id,))
+                    SELECT w.agent_id, w.current_load_score, a.capabilities
+                    FROM agent_workload w
+                    JOIN agents a ON a.id = w.agent_id
+                    WHERE w.current_load_score > ?
+                    ORDER BY w.current_load_score DESC
+                """, (overload_threshold,))
                 
-                tasks_to_redistribute = cursor.fetchall()
+                overloaded_agents = cursor.fetchall()
                 
-                for task in tasks_to_redistribute:
-                    # Find a less loaded agent with matching capabilities
-                    target_agent = self.find_least_loaded_agent(capabilities)
+                for agent_row in overloaded_agents:
+                    agent_id = agent_row['agent_id']
+                    capabilities = _decode_capabilities(agent_row['capabilities'])
+                    
+                    # Find tasks that can be redistributed (pending tasks only)
+                    cursor.execute("""
+                        SELECT id, title, estimated_hours
+                        FROM tasks
+                        WHERE assignee = ? AND status = 'pending'
+                        ORDER BY priority ASC, created_at DESC
+                        LIMIT 5
+                    """, (agent_id,))
                     
-                    if target_agent and target_agent != agent_id:
-                        # Check target agent's load is significantly lower
-                        target_load = self.calculate_agent_load(target_agent)
+                    tasks_to_redistribute = cursor.fetchall()
+                    
+                    for task in tasks_to_redistribute:
+                        # Find a less loaded agent with matching capabilities
+                        candidates = [candidate for candidate in capable_agents(capabilities)
+                                      if candidate != agent_id]
+                        target_agent = min(candidates, key=current_load) if candidates else None
                         
-                        if target_load < (overload_threshold - 20):  # At least 20 points lower
-                            # Reassign the task
-                            cursor.execute("""
-                                UPDATE tasks
-                                SET assignee = ?, updated_at = CURRENT_TIMESTAMP
-                                WHERE id = ?
-                            """, (target_agent, task['id']))
-                            
-                            # Record in task history
-                            cursor.execute("""
-                                INSERT INTO agent_task_history
-                                (agent_id, task_id, action, metadata)
-                                VALUES (?, ?, 'reassigned', ?)
-                            """, (agent_id, task['id'], 
-                                  json.dumps({'from': agent_id, 'to': target_agent, 
-                                            'reason': 'workload_redistribution'})))
-                            
-                            redistributed += 1
-                            logger.info(f"Redistributed task {task['id']} from {agent_id} to {target_agent}")
+                        if target_agent:
+                            # Check target agent's load is significantly lower
+                            target_load = current_load(target_agent)
                             
-                            # Update workload for both agents
-                            self.track_workload(agent_id)
-                            self.track_workload(target_agent)
-                            
-                            # Stop if agent is no longer overloaded
-                            if self.calculate_agent_load(agent_id) < overload_threshold:
-                                break
-            
-            self.conn.commit()
+                            if target_load < (overload_threshold - 20):  # At least 20 points lower
+                                # Queue the reassignment and its history entry
+                                updates.append((target_agent, task['id']))
+                                history.append((agent_id, task['id'], 
+                                                _json_dumps({'from': agent_id, 'to': target_agent, 
+                                                             'reason': 'workload_redistribution'})))
+                                
+                                hours = task['estimated_hours'] or 1
+                                for moved_id, sign in ((agent_id, -1), (target_agent, 1)):
+                                    raw_load[moved_id] = raw_load.get(moved_id, 0) + sign * (10 + 5 * hours)
+                                    work = moved_work.setdefault(moved_id, [0, 0])
+                                    work[0] += sign
+                                    work[1] += sign * hours
+                                
+                                redistributed += 1
+                                logger.info(f"Redistributed task {task['id']} from {agent_id} to {target_agent}")
+                                
+                                # Stop if agent is no longer overloaded
+                                if current_load(agent_id) < overload_threshold:
+                                    break
+                
+                cursor.executemany("""
+                    UPDATE tasks
+                    SET assignee = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, updates)
+                
+                # Record in task history
+                cursor.executemany("""
+                    INSERT INTO agent_task_history
+                    (agent_id, task_id, action, metadata)
+                    VALUES (?, ?, 'reassigned', ?)
+                """, history)
+                
+                # Write back the workload of every agent that gained or lost tasks
+                cursor.executemany("""
+                    UPDATE agent_workload
+                    SET task_count = task_count + ?, estimated_hours = estimated_hours + ?,
+                        current_load_score = ?, last_updated = CURRENT_TIMESTAMP
+                    WHERE agent_id = ?
+                """, [(count, hours, current_load(moved_id), moved_id)
+                      for moved_id, (count, hours) in moved_work.items()])
+            
+            for agent_id in moved_work:
+                self._load_cache.pop(agent_id, None)
             
             if redistributed > 0:
                 logger.info(f"Successfully redistributed {redistributed} tasks")
@@ -505,19 +990,29 @@ class AgentManager:
             value: Metric value
             task_id: Optional task ID for task-specific metrics
         
+        The row is buffered and written with other pending metrics in one
+        transaction (see flush_metrics): by the background flush thread once
+        the oldest buffered row is _METRIC_FLUSH_INTERVAL seconds old, when
+        _METRIC_FLUSH_SIZE rows are pending, or at exit. get_agent_metrics
+        flushes first, so reads always include it.
+        
         Returns:
             True if metric recorded successfully
         """
         try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO agent_metrics
-                (agent_id, metric_type, metric_value, task_id, recorded_at)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (agent_id, metric_type, value, task_id))
-            
-            self.conn.commit()
+            # Same text format as SQLite's CURRENT_TIMESTAMP (UTC)
+            recorded_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            with self._metric_lock:
+                self._metric_buffer.append((agent_id, metric_type, value, task_id, recorded_at))
+                if self._metric_oldest is None:
+                    self._metric_oldest = time.monotonic()
+                due = (len(self._metric_buffer) >= _METRIC_FLUSH_SIZE or
+                       time.monotonic() - self._metric_oldest >= _METRIC_FLUSH_INTERVAL)
+            
+            if due:
+                self.flush_metrics()
+            else:
+                self._ensure_flusher()
             logger.debug(f"Recorded metric {metric_type}={value} for agent {agent_id}")
             return True
             
@@ -525,6 +1020,35 @@ class AgentManager:
             logger.error(f"Failed to record metric for {agent_id}: {e}")
             return False
     
+    def flush_metrics(self) -> int:
+        """
+        Write all buffered metrics in a single transaction
+        
+        Returns:
+            Number of metrics written
+        """
+        with self._metric_lock:
+            pending = self._metric_buffer
+            self._metric_buffer = []
+            self._metric_oldest = None
+        if not pending:
+            return 0
+        
+        try:
+            self.conn.executemany(_SQL_RECORD_METRIC, pending)
+            self.conn.commit()
+            return len(pending)
+            
+        except Exception as e:
+            logger.error(f"Failed to flush metrics: {e}")
+            self.conn.rollback()
+            # Put them back ahead of anything recorded meanwhile
+            with self._metric_lock:
+                self._metric_buffer[:0] = pending
+                if self._metric_oldest is None:
+                    self._metric_oldest = time.monotonic()
+            return 0
+    
     def get_agent_metrics(self, agent_id: str, time_range: str = 'daily') -> Dict:
         """
         Get aggregated performance metrics for an agent
@@ -538,69 +1062,34 @@ class AgentManager:
         Returns:
             Dictionary of aggregated metrics
         """
+        self.flush_metrics()
         try:
             cursor = self.conn.cursor()
             
-            # Determine time filter
-            if time_range == 'daily':
-                time_filter = "datetime('now', '-1 day')"
-            elif time_range == 'weekly':
-                time_filter = "datetime('now', '-7 days')"
-            elif time_range == 'monthly':
-                time_filter = "datetime('now', '-30 days')"
-            else:
-                time_filter = "datetime('now', '-1 day')"
+            # Window start, in CURRENT_TIMESTAMP's UTC text format
+            days = _METRIC_WINDOW_DAYS.get(time_range, 1)
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
             
-            # Get completion rate
-            cursor.execute(f"""
-                SELECT COUNT(*) as total,
-                       SUM(CASE WHEN metric_value > 0 THEN 1 ELSE 0 END) as successful
+            # Completion rate, average duration, quality and tasks handled
+            # in one pass over the agent's metrics in the window
+            cursor.execute("""
+                SELECT SUM(CASE WHEN metric_type = 'task_completion' THEN 1 ELSE 0 END) as total,
+                       SUM(CASE WHEN metric_type = 'task_completion' AND metric_value > 0
+                                THEN 1 ELSE 0 END) as successful,
+                       AVG(CASE WHEN metric_type = 'task_duration' THEN metric_value END) as avg_duration,
+                       AVG(CASE WHEN metric_type = 'quality_score' THEN metric_value END) as avg_quality,
+                       COUNT(DISTINCT task_id) as task_count
                 FROM agent_metrics
-                WHERE agent_id = ? 
-                AND metric_type = 'task_completion'
-                AND recorded_at > {time_filter}
-            """, (agent_id,))
+                WHERE agent_id = ? AND recorded_at > ?
+            """, (agent_id, cutoff))
             
-            completion_data = cursor.fetchone()
+            data = cursor.fetchone()
             completion_rate = 0
-            if completion_data and completion_data['total'] > 0:
-                completion_rate = (completion_data['successful'] / completion_data['total']) * 100
-            
-            # Get average task duration
-            cursor.execute(f"""
-                SELECT AVG(metric_value) as avg_duration
-                FROM agent_metrics
-                WHERE agent_id = ? 
-                AND metric_type = 'task_duration'
-                AND recorded_at > {time_filter}
-            """, (agent_id,))
-            
-            duration_data = cursor.fetchone()
-            avg_duration = duration_data['avg_duration'] if duration_data and duration_data['avg_duration'] else 0
-            
-            # Get quality score (if tracked)
-            cursor.execute(f"""
-                SELECT AVG(metric_value) as avg_quality
-                FROM agent_metrics
-                WHERE agent_id = ? 
-                AND metric_type = 'quality_score'
-                AND recorded_at > {time_filter}
-            """, (agent_id,))
-            
-            quality_data = cursor.fetchone()
-            avg_quality = quality_data['avg_quality'] if quality_data and quality_data['avg_quality'] else 0
-            
-            # Count total tasks handled
-            cursor.execute(f"""
-                SELECT COUNT(DISTINCT task_id) as task_count
-                FROM agent_metrics
-                WHERE agent_id = ? 
-                AND task_id IS NOT NULL
-                AND recorded_at > {time_filter}
-            """, (agent_id,))
-            
-            task_data = cursor.fetchone()
-            task_count = task_data['task_count'] if task_data else 0
+            if data['total']:
+                completion_rate = (data['successful'] / data['total']) * 100
+            avg_duration = data['avg_duration'] or 0
+            avg_quality = data['avg_quality'] or 0
+            task_count = data['task_count']
             
             # Calculate performance score (0-100)
             # Formula: (completion_rate * 0.4) + (100 - min(avg_duration, 100)) * 0.3 + (avg_quality * 0.3)
@@ -643,15 +1132,17 @@ class AgentManager:
             True if message sent successfully
         """
         try:
-            cursor = self.conn.cursor()
+            with self.conn:
+                message_id = self.conn.execute("""
+                    INSERT INTO agent_messages
+                    (from_agent, to_agent, message_type, priority, content, created_at)
+                    VALUES (?, ?, 'direct', ?, ?, CURRENT_TIMESTAMP)
+                """, (from_agent, to_agent, priority, content)).lastrowid
+                self.conn.execute("""
+                    INSERT INTO agent_message_inbox (agent_id, message_id)
+                    VALUES (?, ?)
+                """, (to_agent, message_id))
             
-            cursor.execute("""
-                INSERT INTO agent_messages
-                (from_agent, to_agent, message_type, priority, content, created_at)
-                VALUES (?, ?, 'direct', ?, ?, CURRENT_TIMESTAMP)
-            """, (from_agent, to_agent, priority, content))
-            
-            self.conn.commit()
             logger.info(f"Message sent from {from_agent} to {to_agent}")
             return True
             
@@ -664,6 +1155,10 @@ class AgentManager:
         """
         Broadcast a message to all active agents
         
+        The message is stored once and fanned out to every active agent's
+        inbox by a single INSERT ... SELECT; agents registered later do not
+        receive it.
+        
         @implements FR-020: Agent Communication Channels
         
         Args:
@@ -675,15 +1170,17 @@ class AgentManager:
             True if broadcast sent successfully
         """
         try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO agent_messages
-                (from_agent, to_agent, message_type, priority, content, created_at)
-                VALUES (?, NULL, 'broadcast', ?, ?, CURRENT_TIMESTAMP)
-            """, (from_agent, priority, content))
+            with self.conn:
+                message_id = self.conn.execute("""
+                    INSERT INTO agent_messages
+                    (from_agent, to_agent, message_type, priority, content, created_at)
+                    VALUES (?, NULL, 'broadcast', ?, ?, CURRENT_TIMESTAMP)
+                """, (from_agent, priority, content)).lastrowid
+                self.conn.execute("""
+                    INSERT INTO agent_message_inbox (agent_id, message_id)
+                    SELECT id, ? FROM agents WHERE status = 'active'
+                """, (message_id,))
             
-            self.conn.commit()
             logger.info(f"Broadcast message sent from {from_agent}")
             return True
             
@@ -707,38 +1204,30 @@ class AgentManager:
         try:
             cursor = self.conn.cursor()
             
-            # Get direct messages and broadcasts
+            # Direct messages and broadcasts, with this agent's own status
             cursor.execute("""
-                SELECT m.*, a.name as sender_name
-                FROM agent_messages m
+                SELECT m.id, m.from_agent, m.to_agent, m.message_type, m.priority,
+                       m.content, i.status, m.created_at, i.read_at, m.metadata,
+                       a.name as sender_name
+                FROM agent_message_inbox i
+                JOIN agent_messages m ON m.id = i.message_id
                 JOIN agents a ON m.from_agent = a.id
-                WHERE (m.to_agent = ? OR (m.to_agent IS NULL AND m.message_type = 'broadcast'))
-                AND m.status = ?
-                ORDER BY 
-                    CASE m.priority 
-                        WHEN 'critical' THEN 0
-                        WHEN 'high' THEN 1
-                        WHEN 'normal' THEN 2
-                        WHEN 'low' THEN 3
-                    END,
-                    m.created_at DESC
+                WHERE i.agent_id = ? AND i.status = ?
+                ORDER BY m.priority_rank, m.created_at DESC
             """, (agent_id, status))
             
-            messages = []
-            for row in cursor.fetchall():
-                message = dict(row)
-                
-                # Mark as read if it was unread
-                if status == 'unread':
-                    cursor.execute("""
-                        UPDATE agent_messages
-                        SET status = 'read', read_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (message['id'],))
-                
-                messages.append(message)
+            messages = [dict(row) for row in cursor.fetchall()]
             
+            # Mark unread messages as read, one statement per chunk of ids
             if status == 'unread' and messages:
+                ids = [message['id'] for message in messages]
+                for start in range(0, len(ids), _MAX_SQL_VARIABLES):
+                    chunk = ids[start:start + _MAX_SQL_VARIABLES]
+                    cursor.execute(f"""
+                        UPDATE agent_message_inbox
+                        SET status = 'read', read_at = CURRENT_TIMESTAMP
+                        WHERE agent_id = ? AND message_id IN ({','.join('?' * len(chunk))})
+                    """, [agent_id] + chunk)
                 self.conn.commit()
                 logger.debug(f"Marked {len(messages)} messages as read for {agent_id}")
             
@@ -762,16 +1251,13 @@ class AgentManager:
             True if acknowledgment successful
         """
         try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
-                UPDATE agent_messages
-                SET status = 'acknowledged', read_at = CURRENT_TIMESTAMP
-                WHERE id = ? AND (to_agent = ? OR to_agent IS NULL)
-            """, (message_id, agent_id))
-            
-            self.conn.commit()
-            return cursor.rowcount > 0
+            with self.conn:
+                updated = self.conn.execute("""
+                    UPDATE agent_message_inbox
+                    SET status = 'acknowledged', read_at = CURRENT_TIMESTAMP
+                    WHERE agent_id = ? AND message_id = ?
+                """, (agent_id, message_id)).rowcount
+            return updated > 0
             
         except Exception as e:
             logger.error(f"Failed to acknowledge message {message_id}: {e}")
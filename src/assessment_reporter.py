@@ -6,20 +6,163 @@ Implements v2.3 FR-037 assessment report generation.
 @implements FR-037: 30-Day Assessment Report - comprehensive system evaluation
 """
 import sqlite3
+import hashlib
 import json
+import os
+import re
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
 from metrics_calculator import MetricsCalculator
 
+# Seconds a cached assessment report stays valid
+_REPORT_CACHE_TTL = 3600
+
+# Per-connection tuning applied once per report run
+_REPORT_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Template categories and their keywords, in precedence order: a task
+# counts towards the first category any keyword of which it contains
+_TEMPLATE_KEYWORDS = (
+    ("bug_fix", ("bug", "fix", "error", "issue")),
+    ("feature_development", ("feature", "implement", "add", "create")),
+    ("research", ("research", "investigate", "analyze", "study")),
+    ("documentation", ("document", "write", "readme", "guide")),
+    ("testing", ("test", "verify", "validate", "check")),
+)
+
+# One precompiled alternation per category, searched in precedence order
+_TEMPLATE_REGEXES = tuple(
+    (name, re.compile("|".join(map(re.escape, words))))
+    for name, words in _TEMPLATE_KEYWORDS
+)
+
+_TEMPLATE_CATEGORY_SQL = """
+    SELECT template_category(lower(title || ' ' || COALESCE(description, ''))) as category,
+           COUNT(*)
+    FROM tasks
+    WHERE description IS NOT NULL
+    GROUP BY category
+"""
+
+
+def _template_category(content: str):
+    """First template category whose keywords appear in content, if any"""
+    for name, regex in _TEMPLATE_REGEXES:
+        if regex.search(content):
+            return name
+    return None
+
+
 class AssessmentReporter:
-    def __init__(self, db_path):
+    def __init__(self, db_path, cache_ttl: float = _REPORT_CACHE_TTL):
         self.db_path = db_path
         self.feedback_db_path = ".task-orchestrator/feedback.db"
         self.metrics_calculator = MetricsCalculator(db_path)
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path(db_path).parent / "cache"
+        # Connections shared by the analyses of one report run, by path
+        self._connections: Dict[str, sqlite3.Connection] = {}
+    
+    def _cache_file(self) -> Path:
+        """Cache file for the current data: keyed on database state and the hour"""
+        # Under WAL, writes land in the -wal file first, so it is part of the
+        # key; an empty -wal (left by a checkpoint, removed when the last
+        # connection closes) counts as absent
+        state = []
+        for path in (self.db_path, f"{self.db_path}-wal", self.feedback_db_path):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            state.append(f"{stat.st_mtime_ns}:{stat.st_size}" if stat and stat.st_size else "-")
+        key = hashlib.sha1(
+            f"{'|'.join(state)}|{datetime.now():%Y%m%d%H}".encode()
+        ).hexdigest()
+        return self.cache_dir / f"assessment_{key}.json"
+    
+    def invalidate_cache(self) -> None:
+        """Remove cached assessment reports"""
+        for cached in self.cache_dir.glob("assessment_*.json"):
+            cached.unlink(missing_ok=True)
+    
+    def generate_30_day_assessment(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Generate comprehensive 30-day assessment report (FR-037)
+        
+        A report computed from the same database state within the last
+        cache_ttl seconds is loaded from disk instead of re-running the
+        queries; force_refresh=True always recomputes.
+        """
+        cache_file = self._cache_file()
+        if not force_refresh and cache_file.exists():
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                try:
+                    with open(cache_file) as f:
+                        return json.load(f)
+                except (OSError, ValueError):
+                    pass  # Unreadable cache, recompute
+        
+        report = self._build_30_day_assessment()
+        # Closing the run's connections may checkpoint the WAL into the
+        # database file, so key the cache on the files as they are now
+        cache_file = self._cache_file()
+        
+        try:
+            self.invalidate_cache()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump(report, f)
+        except OSError:
+            pass  # Caching is best effort
+        
+        return report
+    
+    def _open_connection(self, path) -> sqlite3.Connection:
+        """Open a connection to path with the report PRAGMAs applied"""
+        conn = sqlite3.connect(str(path))
+        if path == self.db_path:
+            conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in _REPORT_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _connection(self, path):
+        """Connection to path, reusing the current report run's if open"""
+        conn = self._connections.get(str(path))
+        if conn is not None:
+            yield conn
+            return
+        conn = self._open_connection(path)
+        try:
+            yield conn
+        finally:
+            conn.close()
     
-    def generate_30_day_assessment(self) -> Dict[str, Any]:
-        """Generate comprehensive 30-day assessment report (FR-037)"""
+    def _build_30_day_assessment(self) -> Dict[str, Any]:
+        """Run every analysis for the 30-day assessment over shared connections"""
+        self._connections = {
+            str(path): self._open_connection(path)
+            for path in (self.db_path, self.feedback_db_path)
+            if Path(path).exists()
+        }
+        try:
+            return self._run_analyses()
+        finally:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections = {}
+    
+    def _run_analyses(self) -> Dict[str, Any]:
+        """Assemble the report from each analysis"""
         thirty_days_ago = (datetime.now() - timedelta(days=30)).isoformat()
         
         report = {
@@ -61,29 +204,25 @@ class AssessmentReporter:
     
     def _generate_executive_summary(self, since_date: str) -> Dict[str, Any]:
         """Generate high-level executive summary"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection(self.db_path) as conn:
             cursor = conn.cursor()
             
-            # Total activity metrics
-            cursor.execute("SELECT COUNT(*) FROM tasks WHERE created_at >= ?", (since_date,))
-            total_tasks = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM tasks WHERE status = 'completed' AND created_at >= ?", (since_date,))
-            completed_tasks = cursor.fetchone()[0]
-            
-            # Unique features used
+            # Activity and feature usage in one pass over the window;
+            # feature adoption counts each of success criteria, deadline and
+            # estimate a task uses
             cursor.execute("""
-                SELECT COUNT(DISTINCT 'success_criteria') + COUNT(DISTINCT 'deadline') + 
-                       COUNT(DISTINCT 'estimated_hours') as feature_adoption
+                SELECT COUNT(*) as total_tasks,
+                       SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
+                       SUM(CASE WHEN success_criteria IS NOT NULL THEN 1 ELSE 0 END) +
+                       SUM(CASE WHEN deadline IS NOT NULL THEN 1 ELSE 0 END) +
+                       SUM(CASE WHEN estimated_hours IS NOT NULL THEN 1 ELSE 0 END) as feature_adoption
                 FROM tasks 
-                WHERE created_at >= ? AND (
-                    success_criteria IS NOT NULL OR 
-                    deadline IS NOT NULL OR 
-                    estimated_hours IS NOT NULL
-                )
+                WHERE created_at >= ?
             """, (since_date,))
             
-            feature_adoption = cursor.fetchone()[0]
+            total_tasks, completed_tasks, feature_adoption = cursor.fetchone()
+            completed_tasks = completed_tasks or 0
+            feature_adoption = feature_adoption or 0
             
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
@@ -111,37 +250,30 @@ class AssessmentReporter:
     
     def _analyze_adoption_patterns(self, since_date: str) -> Dict[str, Any]:
         """Analyze user adoption patterns"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection(self.db_path) as conn:
             cursor = conn.cursor()
             
-            # Daily task creation pattern
-            cursor.execute("""
-                SELECT DATE(created_at) as day, COUNT(*) as tasks_created
-                FROM tasks 
-                WHERE created_at >= ?
-                GROUP BY DATE(created_at)
-                ORDER BY day
-            """, (since_date,))
-            
-            daily_creation = dict(cursor.fetchall())
-            
-            # Feature adoption over time
+            # Daily task creation and feature adoption in one grouped pass
             cursor.execute("""
                 SELECT 
                     DATE(created_at) as day,
+                    COUNT(*) as tasks_created,
                     SUM(CASE WHEN success_criteria IS NOT NULL THEN 1 ELSE 0 END) as success_criteria_usage,
                     SUM(CASE WHEN deadline IS NOT NULL THEN 1 ELSE 0 END) as deadline_usage,
                     SUM(CASE WHEN estimated_hours IS NOT NULL THEN 1 ELSE 0 END) as estimation_usage
                 FROM tasks 
                 WHERE created_at >= ?
-                GROUP BY DATE(created_at)
+                GROUP BY day
                 ORDER BY day
             """, (since_date,))
             
-            feature_adoption_trend = [
-                {"day": row[0], "success_criteria": row[1], "deadlines": row[2], "estimation": row[3]}
-                for row in cursor.fetchall()
-            ]
+            daily_creation = {}
+            feature_adoption_trend = []
+            for day, created, criteria, deadlines, estimation in cursor:
+                daily_creation[day] = created
+                feature_adoption_trend.append(
+                    {"day": day, "success_criteria": criteria, "deadlines": deadlines, "estimation": estimation}
+                )
             
         return {
             "daily_task_creation": daily_creation,
@@ -152,7 +284,7 @@ class AssessmentReporter:
     
     def _analyze_feature_usage(self, since_date: str) -> Dict[str, Any]:
         """Analyze which features are being used most"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Core features usage
@@ -215,30 +347,26 @@ class AssessmentReporter:
         
         # Get feedback trends over time
         if Path(self.feedback_db_path).exists():
-            with sqlite3.connect(self.feedback_db_path) as conn:
+            with self._connection(self.feedback_db_path) as conn:
                 cursor = conn.cursor()
                 
-                # Weekly feedback trends
+                # Weekly feedback trends; rounding and NULL handling happen
+                # in SQL so rows only need to be named
                 cursor.execute("""
                     SELECT 
                         strftime('%Y-%W', feedback_date) as week,
-                        AVG(quality_score) as avg_quality,
-                        AVG(timeliness_score) as avg_timeliness,
+                        ROUND(COALESCE(AVG(quality_score), 0), 1) as avg_quality,
+                        ROUND(COALESCE(AVG(timeliness_score), 0), 1) as avg_timeliness,
                         COUNT(*) as feedback_count
                     FROM feedback 
                     WHERE feedback_date >= ?
-                    GROUP BY strftime('%Y-%W', feedback_date)
+                    GROUP BY week
                     ORDER BY week
                 """, (since_date,))
                 
                 weekly_trends = [
-                    {
-                        "week": row[0],
-                        "avg_quality": round(row[1], 1) if row[1] else 0,
-                        "avg_timeliness": round(row[2], 1) if row[1] else 0,
-                        "feedback_count": row[3]
-                    }
-                    for row in cursor.fetchall()
+                    {"week": week, "avg_quality": quality, "avg_timeliness": timeliness, "feedback_count": count}
+                    for week, quality, timeliness, count in cursor
                 ]
                 
                 # Rework correlation analysis
@@ -268,41 +396,19 @@ class AssessmentReporter:
     
     def _analyze_template_usage(self) -> Dict[str, Any]:
         """Analyze template effectiveness"""
-        # Simulate template analysis based on task patterns
-        with sqlite3.connect(self.db_path) as conn:
+        # Simulate template analysis based on task patterns; SQLite calls the
+        # precompiled classifier per row and groups the results
+        with self._connection(self.db_path) as conn:
+            conn.create_function("template_category", 1, _template_category, deterministic=True)
             cursor = conn.cursor()
-            
-            # Look for template-like patterns in task content
-            cursor.execute("""
-                SELECT title, description, status
-                FROM tasks
-                WHERE description IS NOT NULL
-            """)
-            
-            all_tasks = cursor.fetchall()
+            cursor.execute(_TEMPLATE_CATEGORY_SQL)
+            counts = dict(cursor.fetchall())
         
         # Simple template pattern detection
         template_patterns = {
-            "bug_fix": 0,
-            "feature_development": 0,
-            "research": 0,
-            "documentation": 0,
-            "testing": 0
+            name: counts.get(name, 0) for name, _ in _TEMPLATE_KEYWORDS
         }
         
-        for title, desc, status in all_tasks:
-            content = (title + " " + (desc or "")).lower()
-            if any(word in content for word in ["bug", "fix", "error", "issue"]):
-                template_patterns["bug_fix"] += 1
-            elif any(word in content for word in ["feature", "implement", "add", "create"]):
-                template_patterns["feature_development"] += 1
-            elif any(word in content for word in ["research", "investigate", "analyze", "study"]):
-                template_patterns["research"] += 1
-            elif any(word in content for word in ["document", "write", "readme", "guide"]):
-                template_patterns["documentation"] += 1
-            elif any(word in content for word in ["test", "verify", "validate", "check"]):
-                template_patterns["testing"] += 1
-        
         most_used = max(template_patterns.items(), key=lambda x: x[1])
         
         return {
@@ -93,6 +93,9 @@ def handle_admin(command: str, context: CLIContext) -> Optional[int]:
         from config_manager import ConfigManager
 
         config = ConfigManager(str(resolve_config_path()))
+        # ConfigManager itself never writes on read; the config command
+        # materializes the file so users can find and edit it
+        config.ensure_saved()
 
         if "--enable" in argv:
             idx = argv.index("--enable")
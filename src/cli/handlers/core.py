@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from typing import Optional
 
 from cli.context import CLIContext
@@ -265,7 +266,8 @@ def handle_core(command: str, context: CLIContext) -> Optional[int]:
             idx = argv.index("--format")
             if idx + 1 < len(argv):
                 fmt = argv[idx + 1]
-        print(tm.export(format=fmt))
+        tm.export_to_stream(sys.stdout, format=fmt)
+        sys.stdout.write("\n")
         return 0
 
     if command == "watch":
@@ -3,8 +3,10 @@ Configuration Management for Task Orchestrator Core Loop features.
 Provides feature toggles and settings persistence.
 """
 
+import copy
 import os
 import json
+import types
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -14,6 +16,20 @@ except ImportError:
     yaml = None
 from storage_paths import resolve_config_path
 
+_DEFAULT_CONFIG = {
+    'features': {
+        'success-criteria': True,
+        'feedback': True,
+        'telemetry': True,
+        'completion-summaries': True,
+        'time-tracking': True,
+        'deadlines': True
+    },
+    'minimal_mode': False,
+    'telemetry_enabled': True,
+    'version': '2.3.0'
+}
+
 
 class ConfigManager:
     """
@@ -25,26 +41,14 @@ class ConfigManager:
     @implements FR-036: Minimal Mode Configuration
     """
     
-    # Default configuration
-    DEFAULT_CONFIG = {
-        'features': {
-            'success-criteria': True,
-            'feedback': True,
-            'telemetry': True,
-            'completion-summaries': True,
-            'time-tracking': True,
-            'deadlines': True
-        },
-        'minimal_mode': False,
-        'telemetry_enabled': True,
-        'version': '2.3.0'
-    }
+    # Default configuration (read-only view; instances get a deep copy)
+    DEFAULT_CONFIG = types.MappingProxyType(_DEFAULT_CONFIG)
     
     # Valid feature names
-    VALID_FEATURES = {
+    VALID_FEATURES = frozenset({
         'success-criteria', 'feedback', 'telemetry', 
         'completion-summaries', 'time-tracking', 'deadlines'
-    }
+    })
     
     def __init__(self, config_path: str = None):
         """Initialize configuration manager."""
@@ -53,32 +57,36 @@ class ConfigManager:
         else:
             self.config_path = resolve_config_path()
         
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        # Memoized flag lookups, cleared whenever the configuration changes
+        self._flag_cache: Dict[tuple, bool] = {}
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default."""
+        """Load configuration from file, or defaults if none was saved yet."""
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r') as f:
-                    if yaml:
-                        config = yaml.safe_load(f) or {}
-                    else:
-                        # Fallback keeps runtime dependency-free when PyYAML is absent.
-                        config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    return self._merge_with_defaults(config)
+                    text = f.read()
+                try:
+                    # Saved as JSON (a YAML subset), parsed by the C decoder
+                    config = json.loads(text) if text.strip() else {}
+                except ValueError:
+                    # Legacy YAML-formatted file; rewritten as JSON on next save
+                    if not yaml:
+                        raise
+                    config = yaml.safe_load(text) or {}
+                # Merge with defaults to ensure all keys exist
+                return self._merge_with_defaults(config)
             except Exception as e:
                 print(f"Warning: Failed to load config: {e}")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(_DEFAULT_CONFIG)
         else:
-            # Create default config file
-            self._save_config(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+            # Defaults are only written once something is changed or saved
+            return copy.deepcopy(_DEFAULT_CONFIG)
     
     def _merge_with_defaults(self, config: Dict) -> Dict:
         """Merge loaded config with defaults to ensure all keys exist."""
-        merged = self.DEFAULT_CONFIG.copy()
+        merged = copy.deepcopy(_DEFAULT_CONFIG)
         
         # Deep merge
         if 'features' in config:
@@ -94,17 +102,33 @@ class ConfigManager:
         """Save configuration to file."""
         if config is None:
             config = self.config
+        self._config_changed()
         
         try:
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_path, 'w') as f:
-                if yaml:
-                    yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
-                else:
-                    # JSON is valid YAML subset and can be parsed by safe_load later.
-                    json.dump(config, f, indent=2)
+                # JSON is a YAML subset, so YAML tooling can still read the file
+                json.dump(config, f, indent=2)
         except Exception as e:
             print(f"Warning: Failed to save config: {e}")
     
+    def ensure_saved(self):
+        """Write the current configuration if no config file exists yet."""
+        if not self.config_path.exists():
+            self._save_config()
+    
+    def _config_changed(self):
+        """Invalidate memoized flag lookups after a configuration change."""
+        self._flag_cache.clear()
+    
+    def _cached_flag(self, key: tuple, compute) -> bool:
+        """Return the flag for key, computing it once per configuration."""
+        try:
+            return self._flag_cache[key]
+        except KeyError:
+            value = self._flag_cache[key] = compute()
+            return value
+    
     def enable_feature(self, feature: str) -> bool:
         """
         Enable a specific Core Loop feature.
@@ -134,6 +158,10 @@ class ConfigManager:
     
     def is_feature_enabled(self, feature: str) -> bool:
         """Check if a feature is enabled."""
+        return self._cached_flag(('feature', feature), lambda: self._is_enabled(feature))
+    
+    def _is_enabled(self, feature: str) -> bool:
+        """Uncached is_feature_enabled."""
         # Minimal mode overrides all features
         if self.config.get('minimal_mode', False):
             return False
@@ -151,7 +179,7 @@ class ConfigManager:
     
     def reset_to_defaults(self):
         """Reset configuration to default values."""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(_DEFAULT_CONFIG)
         self._save_config()
     
     def get_all_settings(self) -> Dict[str, Any]:
@@ -180,6 +208,10 @@ class ConfigManager:
     
     def is_telemetry_enabled(self) -> bool:
         """Check if telemetry is enabled."""
+        return self._cached_flag(('telemetry',), self._is_telemetry_enabled)
+    
+    def _is_telemetry_enabled(self) -> bool:
+        """Uncached is_telemetry_enabled."""
         if self.is_minimal_mode():
             return False
         return self.config.get('telemetry_enabled', True) and \
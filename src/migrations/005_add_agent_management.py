@@ -56,6 +56,17 @@ def migrate_up(conn=None):
             )
         ''')
         
+        # Normalized agent capabilities, so capability filters use an index
+        # instead of substring-matching the JSON column
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS agent_capabilities (
+                agent_id TEXT NOT NULL,
+                capability TEXT NOT NULL,
+                PRIMARY KEY (agent_id, capability),
+                FOREIGN KEY (agent_id) REFERENCES agents(id)
+            )
+        ''')
+        
         # Create agent_workload table for tracking workload (FR-017)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS agent_workload (
@@ -64,7 +75,7 @@ def migrate_up(conn=None):
                 estimated_hours REAL DEFAULT 0,
                 completed_today INTEGER DEFAULT 0,
                 average_completion_time REAL,
-                current_load_score REAL,  -- Calculated load score
+                current_load_score REAL NOT NULL DEFAULT 0,  -- Calculated load score
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 PRIMARY KEY (agent_id),
                 FOREIGN KEY (agent_id) REFERENCES agents(id)
@@ -99,11 +110,29 @@ def migrate_up(conn=None):
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 read_at TIMESTAMP,
                 metadata TEXT,  -- JSON for additional message data
+                priority_rank INTEGER GENERATED ALWAYS AS (
+                    CASE priority WHEN 'critical' THEN 0 WHEN 'high' THEN 1
+                                  WHEN 'normal' THEN 2 ELSE 3 END
+                ) VIRTUAL,  -- sort key for receive_messages
                 FOREIGN KEY (from_agent) REFERENCES agents(id),
                 FOREIGN KEY (to_agent) REFERENCES agents(id)
             )
         ''')
         
+        # Per-recipient delivery state: one row per recipient of a direct
+        # message, one per active agent for a broadcast
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS agent_message_inbox (
+                agent_id TEXT NOT NULL,
+                message_id INTEGER NOT NULL,
+                status TEXT DEFAULT 'unread',  -- unread, read, acknowledged
+                read_at TIMESTAMP,
+                PRIMARY KEY (agent_id, message_id),
+                FOREIGN KEY (agent_id) REFERENCES agents(id),
+                FOREIGN KEY (message_id) REFERENCES agent_messages(id)
+            )
+        ''')
+        
         # Create agent_task_history for tracking agent-task relationships
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS agent_task_history (
@@ -119,10 +148,13 @@ def migrate_up(conn=None):
         ''')
         
         # Create indexes for performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_workload_load ON agent_workload(current_load_score)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_workload_load ON agent_workload(current_load_score, agent_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_agents_status_id ON agents(status, id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_metrics_agent ON agent_metrics(agent_id, metric_type)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_messages_recipient ON agent_messages(to_agent, status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_task_history ON agent_task_history(agent_id, task_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_capabilities_capability ON agent_capabilities(capability, agent_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_message_inbox_status ON agent_message_inbox(agent_id, status)')
         
         # Record migration
         cursor.execute('''
@@ -154,15 +186,20 @@ def migrate_down(conn=None):
     try:
         # Drop indexes first
         cursor.execute('DROP INDEX IF EXISTS idx_agent_workload_load')
+        cursor.execute('DROP INDEX IF EXISTS idx_agents_status_id')
         cursor.execute('DROP INDEX IF EXISTS idx_agent_metrics_agent')
         cursor.execute('DROP INDEX IF EXISTS idx_agent_messages_recipient')
         cursor.execute('DROP INDEX IF EXISTS idx_agent_task_history')
+        cursor.execute('DROP INDEX IF EXISTS idx_agent_capabilities_capability')
+        cursor.execute('DROP INDEX IF EXISTS idx_agent_message_inbox_status')
         
         # Drop tables in reverse order of dependencies
         cursor.execute('DROP TABLE IF EXISTS agent_task_history')
+        cursor.execute('DROP TABLE IF EXISTS agent_message_inbox')
         cursor.execute('DROP TABLE IF EXISTS agent_messages')
         cursor.execute('DROP TABLE IF EXISTS agent_metrics')
         cursor.execute('DROP TABLE IF EXISTS agent_workload')
+        cursor.execute('DROP TABLE IF EXISTS agent_capabilities')
         cursor.execute('DROP TABLE IF EXISTS agents')
         
         # Remove migration record
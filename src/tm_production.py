@@ -13,6 +13,7 @@ Simple interface for multi-agent task coordination with automatic cleanup
 
 import sys
 import os
+import io
 import json
 import sqlite3
 import argparse
@@ -25,6 +26,10 @@ except ImportError:
     fcntl = None  # Windows doesn't have fcntl
 import shutil
 import tarfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import IntEnum
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -48,6 +53,38 @@ _DEFAULT_RETENTION_DAYS = 30
 _AUTO_CLEANUP = True
 _COMPRESS_ARCHIVES = True
 _MAX_CONTEXT_SIZE_MB = 10
+_AGGREGATE_FIELDS = frozenset({"status", "priority", "assignee", "created_by", "phase_id"})
+_LIST_CACHE_SIZE = 8
+# Keys add_many() accepts in a task spec (add()'s keyword arguments)
+_ADD_MANY_FIELDS = frozenset({
+    "title", "description", "priority", "depends_on", "success_criteria",
+    "deadline", "estimated_hours", "assignee", "phase_id", "context",
+})
+_COLUMN_FIELDS = frozenset({
+    "id", "title", "status", "priority", "assignee", "created_by",
+    "created_at", "updated_at", "completed_at", "deadline", "phase_id",
+})
+
+
+class Priority(IntEnum):
+    """Task priority levels, ordered so comparisons are plain integer ops"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+    @classmethod
+    def parse(cls, value) -> "Priority":
+        """Convert a stored priority string (or Priority) to a Priority"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).upper()]
+        except KeyError:
+            raise ValueError("Invalid priority") from None
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
 
 class TaskManager:
     """
@@ -74,6 +111,12 @@ class TaskManager:
         self.db_path = resolve_db_path()
         self.config_dir = self.db_dir / "config"
         self.agent_id_file = self.config_dir / "agent-id"
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        self._local = threading.local()
+        # Every thread's _reader() connection, so close() can close them all
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
         
         # Multi-Layer Agent ID Resolution System
         self.agent_id = self._resolve_agent_id(agent_id_override)
@@ -119,6 +162,54 @@ class TaskManager:
                 self.error_handler.handle_error(e, "Telemetry initialization")
             self.telemetry = None
     
+    @contextmanager
+    def connection(self):
+        """
+        Yield a shared, long-lived connection to the task database
+        
+        The connection is opened on first use and reused afterwards, so
+        per-connection PRAGMAs persist between callers. Access is
+        serialized by a lock; the block commits on success and rolls back
+        on error.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(
+                    str(self.db_path), timeout=10.0, check_same_thread=False
+                )
+            with self._conn:
+                yield self._conn
+    
+    def _reader(self) -> sqlite3.Connection:
+        """
+        Return this thread's cached read-only connection
+        
+        SQLite connections must not be shared between threads, so each
+        thread gets its own, opened once and reused for later lookups.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can close every
+            # thread's reader; each is otherwise used by its own thread
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            with self._readers_lock:
+                self._readers.append(conn)
+            self._local.conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Close the shared connection and every thread's reader connection"""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+            self._local = threading.local()
+        for reader in readers:
+            reader.close()
+    
     def _find_repo_root(self) -> Path:
         """Find git repository root"""
         try:
@@ -430,6 +521,22 @@ class TaskManager:
                             # Column might already exist, ignore the error
                             pass
                     
+                    # Covers status counts overall and per assignee (count_by_status)
+                    conn.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_tasks_assignee_status
+                        ON tasks(assignee, status)
+                    """)
+                    # Covers status filters narrowed by assignee, e.g. list(unassigned=True)
+                    conn.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_tasks_status_assignee
+                        ON tasks(status, assignee)
+                    """)
+                    # Range scans over a reporting window (assessment reports)
+                    conn.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_tasks_created_at
+                        ON tasks(created_at)
+                    """)
+                    
                     conn.commit()
                     break  # Success, exit retry loop
                     
@@ -538,8 +645,9 @@ class TaskManager:
                 raise ValueError("Task title cannot be empty")
         if len(title) > 500:
             raise ValueError("Task title too long (max 500 characters)")
-        if priority and priority not in {"low", "medium", "high"}:
-            raise ValueError("Invalid priority")
+        if priority:
+            # Stored as the lowercase name so existing databases stay readable
+            priority = str(Priority.parse(priority))
         
         # Validate Commander's Intent when assigning to agents
         if assignee:
@@ -559,29 +667,7 @@ class TaskManager:
         
         # Validate success criteria if provided
         if success_criteria:
-            try:
-                import json
-                parsed = json.loads(success_criteria)
-                # Additional validation
-                if not isinstance(parsed, list):
-                    raise ValueError("Success criteria must be a JSON array")
-                for criterion in parsed:
-                    if not isinstance(criterion, dict):
-                        raise ValueError("Each criterion must be a JSON object")
-                    if 'criterion' not in criterion:
-                        raise ValueError("Each criterion must have a 'criterion' field")
-            except json.JSONDecodeError as e:
-                if self.error_handler:
-                    from error_handler import ValidationError
-                    raise ValidationError(f"Invalid JSON in success criteria: {e}")
-                else:
-                    raise ValueError("Success criteria must be valid JSON")
-            except ValueError as e:
-                if self.error_handler:
-                    from error_handler import ValidationError
-                    raise ValidationError(str(e))
-                else:
-                    raise
+            self._validate_success_criteria(success_criteria)
         
         task_id = uuid.uuid4().hex[:8]
         now = datetime.now().isoformat()
@@ -734,30 +820,220 @@ class TaskManager:
         
         return task_id
     
+    def _validate_success_criteria(self, success_criteria: str):
+        """Check success criteria are a JSON array of {'criterion': ...} objects"""
+        try:
+            import json
+            parsed = json.loads(success_criteria)
+            # Additional validation
+            if not isinstance(parsed, list):
+                raise ValueError("Success criteria must be a JSON array")
+            for criterion in parsed:
+                if not isinstance(criterion, dict):
+                    raise ValueError("Each criterion must be a JSON object")
+                if 'criterion' not in criterion:
+                    raise ValueError("Each criterion must have a 'criterion' field")
+        except json.JSONDecodeError as e:
+            if self.error_handler:
+                from error_handler import ValidationError
+                raise ValidationError(f"Invalid JSON in success criteria: {e}")
+            else:
+                raise ValueError("Success criteria must be valid JSON")
+        except ValueError as e:
+            if self.error_handler:
+                from error_handler import ValidationError
+                raise ValidationError(str(e))
+            else:
+                raise
+    
+    def add_many(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several tasks in one transaction
+        
+        Each entry takes add()'s keywords (title, description, priority,
+        depends_on, success_criteria, deadline, estimated_hours, assignee,
+        phase_id, context); any other key is a ValueError. Entries in
+        depends_on may be existing task IDs or integer indexes of other
+        entries in the same batch. All
+        dependency IDs are resolved with a single query and the batch graph
+        is checked for cycles before anything is written.
+        
+        @implements FR-CORE-1: Task Creation System
+        @implements FR-003: Task Dependency System
+        """
+        from dependency_graph import DependencyGraph
+        
+        task_ids = [uuid.uuid4().hex[:8] for _ in tasks]
+        now = datetime.now().isoformat()
+        rows = []
+        edges = []
+        external_deps = set()
+        
+        for index, spec in enumerate(tasks):
+            unknown = spec.keys() - _ADD_MANY_FIELDS
+            if unknown:
+                raise ValueError(f"Unsupported task field(s): {', '.join(sorted(unknown))}")
+            title = spec.get('title')
+            if not title or not title.strip():
+                raise ValueError("Task title cannot be empty")
+            if len(title) > 500:
+                raise ValueError("Task title too long (max 500 characters)")
+            priority = str(Priority.parse(spec.get('priority') or 'medium'))
+            if spec.get('success_criteria'):
+                self._validate_success_criteria(spec['success_criteria'])
+            
+            for dep in spec.get('depends_on') or []:
+                if isinstance(dep, bool) or not isinstance(dep, (int, str)):
+                    raise ValueError(f"Invalid dependency: {dep!r}")
+                if isinstance(dep, int):
+                    if not 0 <= dep < len(tasks) or dep == index:
+                        raise ValueError(f"Invalid dependency index: {dep}")
+                    dep = task_ids[dep]
+                else:
+                    dep = dep.strip()
+                    if not re.fullmatch(r"[a-f0-9]{8}", dep):
+                        raise ValueError(f"Invalid dependency ID: {dep}")
+                    external_deps.add(dep)
+                edges.append((task_ids[index], dep))
+            
+            rows.append([task_ids[index], title, spec.get('description'), 'pending',
+                         priority, spec.get('assignee'), self.agent_id, now, now,
+                         spec.get('success_criteria'), spec.get('deadline'),
+                         spec.get('estimated_hours'), spec.get('phase_id'), spec.get('context')])
+        
+        graph = DependencyGraph()
+        for task_id in task_ids:
+            graph.add_node(task_id)
+        for task_id, dep in edges:
+            graph.add_edge(task_id, dep)
+        if graph.topological_sort() is None:
+            raise ValueError("Circular dependency detected in task batch")
+        
+        try:
+            with sqlite3.connect(str(self.db_path), timeout=10.0) as conn:
+                dep_status = {}
+                if external_deps:
+                    placeholders = ','.join('?' for _ in external_deps)
+                    cursor = conn.execute(
+                        f"SELECT id, status FROM tasks WHERE id IN ({placeholders})",
+                        list(external_deps),
+                    )
+                    dep_status = dict(cursor.fetchall())
+                    missing_deps = external_deps - dep_status.keys()
+                    if missing_deps:
+                        raise ValueError(f"Invalid dependency ID: {', '.join(sorted(missing_deps))}")
+                
+                # Batch members start pending, so any in-batch dependency blocks
+                blocked = {task_id for task_id, dep in edges
+                           if dep_status.get(dep, 'pending') != 'completed'}
+                for row in rows:
+                    if row[0] in blocked:
+                        row[3] = 'blocked'
+                
+                conn.executemany("""
+                    INSERT INTO tasks (id, title, description, status, priority, assignee, created_by,
+                                       created_at, updated_at, success_criteria, deadline,
+                                       estimated_hours, phase_id, context)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                conn.executemany("""
+                    INSERT INTO dependencies (task_id, depends_on)
+                    VALUES (?, ?)
+                """, edges)
+                conn.commit()
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Database integrity error: {e}")
+        
+        if self.telemetry:
+            for task_id, spec in zip(task_ids, tasks):
+                self.telemetry.capture_task_created(
+                    task_id,
+                    has_criteria=bool(spec.get('success_criteria')),
+                    has_deadline=bool(spec.get('deadline')),
+                    has_estimate=bool(spec.get('estimated_hours'))
+                )
+        
+        return task_ids
+    
+    def add_dependencies(self, edges: List[tuple]) -> int:
+        """
+        Add (task_id, depends_on) dependency edges between existing tasks
+        
+        All edges are validated with one lookup, checked for cycles against
+        the existing dependency graph, and written in a single transaction.
+        Tasks gaining an incomplete dependency are marked blocked.
+        Returns the number of new edges.
+        
+        @implements FR-003: Task Dependency System
+        """
+        from dependency_graph import DependencyGraph
+        
+        edges = list(dict.fromkeys((task_id, dep) for task_id, dep in edges))
+        if not edges:
+            return 0
+        if any(task_id == dep for task_id, dep in edges):
+            raise ValueError("A task cannot depend on itself")
+        
+        with sqlite3.connect(str(self.db_path), timeout=10.0) as conn:
+            ids = {task_id for edge in edges for task_id in edge}
+            placeholders = ','.join('?' for _ in ids)
+            cursor = conn.execute(
+                f"SELECT id, status FROM tasks WHERE id IN ({placeholders})", list(ids)
+            )
+            status_by_id = dict(cursor.fetchall())
+            missing = ids - status_by_id.keys()
+            if missing:
+                raise ValueError(f"Invalid dependency ID: {', '.join(sorted(missing))}")
+            
+            graph = DependencyGraph()
+            for task_id, dep in conn.execute("SELECT task_id, depends_on FROM dependencies"):
+                graph.add_edge(task_id, dep)
+            for task_id, dep in edges:
+                graph.add_edge(task_id, dep)
+            if graph.topological_sort() is None:
+                raise ValueError("Circular dependency detected")
+            
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO dependencies (task_id, depends_on)
+                VALUES (?, ?)
+            """, edges)
+            added = conn.total_changes - before
+            
+            blocked = {task_id for task_id, dep in edges
+                       if status_by_id[dep] != 'completed' and status_by_id[task_id] == 'pending'}
+            if blocked:
+                now = datetime.now().isoformat()
+                conn.executemany(
+                    "UPDATE tasks SET status = 'blocked', updated_at = ? WHERE id = ?",
+                    [(now, task_id) for task_id in blocked]
+                )
+            conn.commit()
+        
+        return added
+    
     def show(self, task_id: str) -> Optional[Dict]:
         """Show details of a specific task"""
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT t.*, 
-                           GROUP_CONCAT(d.depends_on) as dependencies
-                    FROM tasks t
-                    LEFT JOIN dependencies d ON t.id = d.task_id
-                    WHERE t.id = ?
-                    GROUP BY t.id
-                """, (task_id,))
-                
-                row = cursor.fetchone()
-                if row:
-                    task = dict(row)
-                    # Convert dependencies string to list
-                    if task.get('dependencies'):
-                        task['dependencies'] = task['dependencies'].split(',')
-                    else:
-                        task['dependencies'] = []
-                    return task
-                return None
+            cursor = self._reader().execute("""
+                SELECT t.*, 
+                       GROUP_CONCAT(d.depends_on) as dependencies
+                FROM tasks t
+                LEFT JOIN dependencies d ON t.id = d.task_id
+                WHERE t.id = ?
+                GROUP BY t.id
+            """, (task_id,))
+            
+            row = cursor.fetchone()
+            if row:
+                task = dict(row)
+                # Convert dependencies string to list
+                if task.get('dependencies'):
+                    task['dependencies'] = task['dependencies'].split(',')
+                else:
+                    task['dependencies'] = []
+                return task
+            return None
         except Exception as e:
             print(f"Error showing task: {e}")
             return None
@@ -814,6 +1090,31 @@ class TaskManager:
             print(f"Unexpected error: {e}")
             return False
     
+    def assign_many(self, assignments: List[tuple]) -> int:
+        """
+        Apply (task_id, assignee) pairs in a single transaction
+        
+        Returns the number of tasks updated; unknown IDs are skipped.
+        
+        @implements FR-016: Agent Task Assignment
+        """
+        assignments = list(assignments)
+        if any(not task_id or not task_id.strip() for task_id, _ in assignments):
+            raise ValueError("Task ID cannot be empty")
+        if any(not assignee for _, assignee in assignments):
+            raise ValueError("Assignee cannot be empty")
+        if not assignments:
+            return 0
+        
+        now = datetime.now().isoformat()
+        with sqlite3.connect(str(self.db_path), timeout=10.0) as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE tasks SET assignee = ?, updated_at = ? WHERE id = ?",
+                [(assignee, now, task_id) for task_id, assignee in assignments],
+            )
+            return conn.total_changes - before
+    
     def delete(self, task_id: str) -> bool:
         """Delete a task and clean up dependencies"""
         try:
@@ -887,6 +1188,51 @@ class TaskManager:
             print(f"Error checking notifications: {e}")
             return []
     
+    def watch_many(self, agent_ids: List[str], limit: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Fetch unread notifications for several agents with one query
+        
+        Each agent gets up to limit of its own notifications plus any
+        broadcasts (no agent_id), newest first. Everything returned is
+        marked read in the same transaction.
+        """
+        agent_ids = list(dict.fromkeys(agent_ids))
+        result = {agent_id: [] for agent_id in agent_ids}
+        if not agent_ids:
+            return result
+        
+        placeholders = ','.join('?' for _ in agent_ids)
+        try:
+            with sqlite3.connect(str(self.db_path), timeout=10.0) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(f"""
+                    SELECT * FROM notifications 
+                    WHERE (agent_id IN ({placeholders}) OR agent_id IS NULL)
+                    AND read = 0
+                    ORDER BY created_at DESC
+                """, agent_ids)
+                
+                for row in cursor:
+                    notification = dict(row)
+                    recipients = [notification['agent_id']] if notification['agent_id'] else agent_ids
+                    for agent_id in recipients:
+                        if len(result[agent_id]) < limit:
+                            result[agent_id].append(notification)
+                
+                conn.execute(f"""
+                    UPDATE notifications 
+                    SET read = 1 
+                    WHERE (agent_id IN ({placeholders}) OR agent_id IS NULL)
+                    AND read = 0
+                """, agent_ids)
+                
+                conn.commit()
+                return result
+                
+        except Exception as e:
+            print(f"Error checking notifications: {e}")
+            return {agent_id: [] for agent_id in agent_ids}
+    
     def _create_notification(self, conn, task_id: str, type: str, message: str, 
                            agent_id: str = None):
         """Create a notification (internal helper)"""
@@ -1025,43 +1371,56 @@ class TaskManager:
     
     def export(self, format: str = "json") -> str:
         """Export all tasks in specified format"""
-        tasks = self.list()
-        
-        if format == "json":
-            return json.dumps(tasks, indent=2)
-        elif format == "markdown":
-            output = ["# Task Orchestrator Export", ""]
-            output.append(f"Generated: {datetime.now().isoformat()}")
-            output.append("")
-            
-            # Group by status
-            statuses = {}
-            for task in tasks:
-                status = task.get('status', 'unknown')
-                if status not in statuses:
-                    statuses[status] = []
-                statuses[status].append(task)
-            
-            for status, status_tasks in statuses.items():
-                output.append(f"## {status.title()} Tasks")
-                output.append("")
-                for task in status_tasks:
-                    output.append(f"- **[{task['id']}]** {task['title']}")
-                    if task.get('description'):
-                        output.append(f"  - Description: {task['description']}")
-                    if task.get('assignee'):
-                        output.append(f"  - Assignee: {task['assignee']}")
-                    if task.get('priority') and task['priority'] != 'medium':
-                        output.append(f"  - Priority: {task['priority']}")
-                output.append("")
+        buffer = io.StringIO()
+        self.export_to_stream(buffer, format)
+        return buffer.getvalue()
+    
+    def export_to_stream(self, fp, format: str = "json") -> None:
+        """
+        Write all tasks to a text stream in the specified format
+        
+        Rows are serialized as they are read, so JSON and TSV exports never
+        hold the full payload in memory. Output matches export().
+        """
+        with sqlite3.connect(str(self.db_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute("SELECT * FROM tasks ORDER BY created_at DESC")
             
-            return "\n".join(output)
-        else:
-            # Default TSV format
-            output = []
-            for task in tasks:
-                output.append(f"{task['id']}\t{task['title']}\t{task['status']}\t{task.get('assignee', '')}")
-            return "\n".join(output)
+            if format == "json":
+                # Same layout as json.dumps(tasks, indent=2)
+                first = True
+                fp.write("[")
+                for row in cursor:
+                    fp.write("\n  " if first else ",\n  ")
+                    fp.write(json.dumps(dict(row), indent=2).replace("\n", "\n  "))
+                    first = False
+                fp.write("]" if first else "\n]")
+            elif format == "markdown":
+                fp.write("# Task Orchestrator Export\n\n")
+                fp.write(f"Generated: {datetime.now().isoformat()}\n")
+                
+                # Group by status
+                statuses = {}
+                for row in cursor:
+                    task = dict(row)
+                    statuses.setdefault(task.get('status', 'unknown'), []).append(task)
+                
+                for status, status_tasks in statuses.items():
+                    fp.write(f"\n## {status.title()} Tasks\n\n")
+                    for task in status_tasks:
+                        fp.write(f"- **[{task['id']}]** {task['title']}\n")
+                        if task.get('description'):
+                            fp.write(f"  - Description: {task['description']}\n")
+                        if task.get('assignee'):
+                            fp.write(f"  - Assignee: {task['assignee']}\n")
+                        if task.get('priority') and task['priority'] != 'medium':
+                            fp.write(f"  - Priority: {task['priority']}\n")
+            else:
+                # Default TSV format
+                separator = ""
+                for row in cursor:
+                    fp.write(f"{separator}{row['id']}\t{row['title']}\t{row['status']}\t{row['assignee']}")
+                    separator = "\n"
     
     def list(
         self,
@@ -1069,10 +1428,14 @@ class TaskManager:
         assignee: str = None,
         has_deps: bool = False,
         limit: int | None = None,
+        unassigned: bool = False,
     ) -> List[Dict]:
         """
         List tasks with optional filters
         
+        unassigned=True keeps only tasks with no assignee and is resolved
+        in SQL, so assigned rows are never fetched.
+        
         @implements FR-CORE-2: Task Listing and Query System
         @implements FR-007: Task Status Filtering
         @implements FR-008: Task Assignment Filtering
@@ -1097,16 +1460,82 @@ class TaskManager:
         if assignee:
             query += " AND assignee = ?"
             params.append(assignee)
+        elif unassigned:
+            query += " AND (assignee IS NULL OR assignee = '')"
         
         query += " ORDER BY created_at DESC"
         if limit is not None and limit > 0:
             query += " LIMIT ?"
             params.append(limit)
         
+        # Results are cached per thread until the database changes. The
+        # reader connection never writes, so its data_version moves on every
+        # commit from any other connection, this process's writes included.
+        reader = self._reader()
+        version = reader.execute("PRAGMA data_version").fetchone()[0]
+        cache = getattr(self._local, "list_cache", None)
+        if cache is None or self._local.list_cache_version != version:
+            cache = self._local.list_cache = OrderedDict()
+            self._local.list_cache_version = version
+        
+        key = (query, tuple(params))
+        rows = cache.get(key)
+        if rows is None:
+            rows = [dict(row) for row in reader.execute(query, params).fetchall()]
+            cache[key] = rows
+            if len(cache) > _LIST_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return [dict(row) for row in rows]
+    
+    def aggregate(self, field: str) -> Dict[Optional[str], int]:
+        """
+        Count tasks grouped by a single column, computed inside SQLite
+        
+        @implements FR-CORE-2: Task Listing and Query System
+        """
+        if field not in _AGGREGATE_FIELDS:
+            raise ValueError(f"Cannot aggregate tasks by: {field}")
+        
         with sqlite3.connect(str(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            cursor = conn.execute(f"SELECT {field}, COUNT(*) FROM tasks GROUP BY {field}")
+            return dict(cursor.fetchall())
+    
+    def list_columns(self, fields: List[str]) -> Dict[str, List[Any]]:
+        """
+        Fetch selected task columns as parallel lists, one per field
+        
+        Only the requested columns are read and no per-row dicts are built,
+        which suits scans that touch a few fields of every task.
+        
+        @implements FR-CORE-2: Task Listing and Query System
+        """
+        invalid = [field for field in fields if field not in _COLUMN_FIELDS]
+        if invalid or not fields:
+            raise ValueError(f"Cannot list task columns: {', '.join(invalid) or '(none)'}")
+        
+        rows = self._reader().execute(
+            f"SELECT {', '.join(fields)} FROM tasks ORDER BY created_at DESC"
+        ).fetchall()
+        columns = list(zip(*rows)) if rows else [() for _ in fields]
+        return {field: list(column) for field, column in zip(fields, columns)}
+    
+    def count_by_status(self, assignee: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count tasks per status, optionally for one assignee, without fetching rows
+        
+        @implements FR-CORE-2: Task Listing and Query System
+        """
+        query = "SELECT status, COUNT(*) FROM tasks"
+        params = []
+        if assignee is not None:
+            query += " WHERE assignee = ?"
+            params.append(assignee)
+        query += " GROUP BY status"
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            return dict(conn.execute(query, params).fetchall())
     
     def join(self, task_id: str) -> bool:
         """Join a task's collaborative context"""
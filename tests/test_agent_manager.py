@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Tests for AgentManager workload, metrics and messaging.
+@implements FR-017: Agent Workload Distribution
+@implements FR-019: Agent Performance Metrics
+@implements FR-020: Agent Communication Channels
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestAgentManager(unittest.TestCase):
+    """AgentManager tests against a throwaway database."""
+
+    def setUp(self):
+        """Set up test environment."""
+        from agent_manager import AgentManager
+
+        self.test_dir = tempfile.mkdtemp(prefix="test_am_")
+        self.db_path = str(Path(self.test_dir) / "tasks.db")
+        self.am = AgentManager(self.db_path)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.am.__exit__(None, None, None)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_tasks(self, rows):
+        """Create the slice of the tasks table AgentManager reads, with rows."""
+        self.am.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY, title TEXT, status TEXT, assignee TEXT,
+                priority TEXT DEFAULT 'medium', estimated_hours REAL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self.am.conn.executemany(
+            "INSERT INTO tasks (id, title, status, assignee, estimated_hours) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.am.conn.commit()
+
+    def test_connection_uses_wal(self):
+        """The manager switches the database to WAL on open."""
+        mode = self.am.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_heartbeats_are_buffered_then_flushed(self):
+        """Heartbeats are visible immediately and written in one batch."""
+        self.am.register_agent("alice", "Alice")
+        self.am.register_agent("bob", "Bob")
+        self.am.conn.execute("UPDATE agents SET last_heartbeat = NULL")
+        self.am.conn.commit()
+
+        with mock.patch("agent_manager._HEARTBEAT_FLUSH_INTERVAL", 3600):
+            self.assertTrue(self.am.update_heartbeat("alice"))
+            self.assertTrue(self.am.update_heartbeat("bob"))
+            self.assertFalse(self.am.update_heartbeat("nobody"))
+
+        self.assertIsNotNone(self.am.get_agent("alice")["last_heartbeat"])
+        self.assertTrue(all(a["last_heartbeat"] for a in self.am.discover_agents()))
+        self.assertEqual(self.am.flush_heartbeats(), 2)
+        stored = self.am.conn.execute(
+            "SELECT COUNT(*) FROM agents WHERE last_heartbeat IS NOT NULL"
+        ).fetchone()[0]
+        self.assertEqual(stored, 2)
+        self.assertEqual(self.am.flush_heartbeats(), 0)
+
+    def test_idle_heartbeats_flushed_in_background(self):
+        """A buffered heartbeat reaches the database without another call."""
+        import sqlite3
+        import time
+
+        self.am.register_agent("alice", "Alice")
+        self.am.conn.execute("UPDATE agents SET last_heartbeat = NULL")
+        self.am.conn.commit()
+
+        with mock.patch("agent_manager._HEARTBEAT_FLUSH_INTERVAL", 0.05):
+            self.assertTrue(self.am.update_heartbeat("alice"))
+
+        deadline = time.monotonic() + 5
+        with sqlite3.connect(self.db_path) as reader:
+            while time.monotonic() < deadline:
+                stored = reader.execute(
+                    "SELECT last_heartbeat FROM agents WHERE id = 'alice'").fetchone()[0]
+                if stored:
+                    break
+                time.sleep(0.02)
+        reader.close()
+        self.assertIsNotNone(stored)
+
+        thread = self.am._flush_thread
+        self.am.__exit__(None, None, None)
+        self.assertFalse(thread.is_alive())
+
+    def test_least_loaded_agent_matches_all_capabilities(self):
+        """Capability filters require every capability, exactly."""
+        self.am.register_agent("alice", "Alice", capabilities=["python", "sql"])
+        self.am.register_agent("bob", "Bob", capabilities=["python"])
+        self.am.register_agent("carol", "Carol", capabilities=["python-web"])
+        self.am.conn.execute("UPDATE agent_workload SET current_load_score = 50 WHERE agent_id = 'alice'")
+        self.am.conn.execute("UPDATE agent_workload SET current_load_score = 10 WHERE agent_id = 'bob'")
+        self.am.conn.commit()
+
+        self.assertEqual(self.am.find_least_loaded_agent(["python"]), "bob")
+        self.assertEqual(self.am.find_least_loaded_agent(["python", "sql", "python"]), "alice")
+        self.assertIsNone(self.am.find_least_loaded_agent(["rust"]))
+        self.assertEqual(self.am.find_least_loaded_agent(), "carol")
+
+        # Re-registering replaces the capability rows
+        self.am.register_agent("bob", "Bob", capabilities=["rust"])
+        self.assertEqual(self.am.find_least_loaded_agent(["python"]), "alice")
+        self.assertEqual(self.am.find_least_loaded_agent(["rust"]), "bob")
+
+    def test_track_workload_aggregates_in_one_query(self):
+        """track_workload() counts active work, today's completions and history."""
+        self.am.register_agent("alice", "Alice")
+        self._create_tasks([
+            ("t1", "One", "pending", "alice", 2),
+            ("t2", "Two", "in_progress", "alice", None),
+            ("t3", "Three", "completed", "alice", 4),
+            ("t4", "Four", "pending", "bob", 8),
+        ])
+        self.am.conn.executemany(
+            "INSERT INTO agent_task_history (agent_id, task_id, action, duration_minutes) VALUES (?, ?, ?, ?)",
+            [("alice", "t3", "completed", 30), ("alice", "t5", "completed", 60), ("alice", "t1", "started", 5)],
+        )
+        self.am.conn.commit()
+
+        workload = self.am.track_workload("alice")
+
+        self.assertEqual(workload["task_count"], 2)
+        self.assertEqual(workload["estimated_hours"], 3)
+        self.assertEqual(workload["completed_today"], 1)
+        self.assertEqual(workload["average_completion_time"], 45)
+        self.assertEqual(workload["load_score"], 30)
+        idle = self.am.track_workload("nobody")
+        self.assertEqual((idle["task_count"], idle["load_score"]), (0, 0))
+
+    def test_capabilities_round_trip(self):
+        """Capabilities are stored as compact JSON and decoded on read."""
+        self.am.register_agent("alice", "Alice", capabilities=["python", "sql"])
+        self.am.register_agent("bob", "Bob")
+
+        stored = self.am.conn.execute("SELECT capabilities FROM agents WHERE id = 'alice'").fetchone()[0]
+        self.assertEqual(stored, '["python","sql"]')
+        self.assertEqual(self.am.get_agent("alice")["capabilities"], ["python", "sql"])
+        self.assertEqual({a["id"]: a["capabilities"] for a in self.am.discover_agents()},
+                         {"alice": ["python", "sql"], "bob": []})
+        self.assertEqual(self.am.discover_agents()[0], self.am.get_agent("alice"))
+
+        first = self.am.get_agent("alice")["capabilities"]
+        first.append("mutated by caller")
+        self.assertEqual(self.am.get_agent("alice")["capabilities"], ["python", "sql"])
+
+    def test_redistribute_tasks_moves_work_in_one_batch(self):
+        """Overloaded agents hand pending tasks to idle agents with the same capabilities."""
+        self.am.register_agent("alice", "Alice", capabilities=["python"])
+        self.am.register_agent("bob", "Bob", capabilities=["python"])
+        self._create_tasks([(f"t{i}", f"Task {i}", "pending", "alice", 1) for i in range(10)])
+        self.am.track_workload("alice")
+        self.am.track_workload("bob")
+
+        moved = self.am.redistribute_tasks(overload_threshold=80)
+
+        # Bob takes tasks until his load would reach threshold - 20
+        self.assertEqual(moved, 4)
+        owners = dict(self.am.conn.execute("SELECT id, assignee FROM tasks").fetchall())
+        self.assertEqual(sum(1 for owner in owners.values() if owner == "bob"), 4)
+        history = self.am.conn.execute(
+            "SELECT COUNT(*) FROM agent_task_history WHERE action = 'reassigned'").fetchone()[0]
+        self.assertEqual(history, 4)
+        stored = self.am.conn.execute(
+            "SELECT task_count, current_load_score FROM agent_workload WHERE agent_id = 'bob'").fetchone()
+        self.assertEqual(tuple(stored), (4, 60))
+        self.assertEqual(self.am.calculate_agent_load("bob"), 60)
+
+    def test_redistribute_tasks_spreads_over_targets(self):
+        """Each moved task goes to whichever eligible agent is least loaded at that point."""
+        for agent_id in ("x", "a", "b"):
+            self.am.register_agent(agent_id, agent_id.upper(), capabilities=["python"])
+        self._create_tasks([(f"x{i}", f"Task {i}", "pending", "x", 1) for i in range(9)]
+                           + [("b1", "B's task", "in_progress", "b", 0)])
+        for agent_id in ("x", "a", "b"):
+            self.am.track_workload(agent_id)
+        self.assertEqual([self.am.calculate_agent_load(a) for a in ("x", "a", "b")], [100, 0, 10])
+
+        moved = self.am.redistribute_tasks(overload_threshold=80)
+
+        self.assertEqual(moved, 4)
+        counts = dict(self.am.conn.execute(
+            "SELECT assignee, COUNT(*) FROM tasks WHERE id LIKE 'x%' GROUP BY assignee").fetchall())
+        self.assertEqual(counts, {"x": 5, "a": 2, "b": 2})
+
+    def test_indexes_created_on_open(self):
+        """Reopening adds the composite indexes, including the tasks ones."""
+        from agent_manager import AgentManager
+
+        self._create_tasks([])
+        AgentManager(self.db_path).__exit__(None, None, None)
+
+        names = {row[0] for row in self.am.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertLessEqual({"idx_agent_message_inbox_status", "idx_agents_status_id",
+                              "idx_hist_agent_action_ts", "idx_metrics_agent_type_time",
+                              "idx_tasks_assignee_completed_date"}, names)
+
+    def test_agent_load_cached_until_ttl_or_refresh(self):
+        """calculate_agent_load() reuses a fresh score; track_workload() refreshes it."""
+        self.am.register_agent("alice", "Alice")
+        self._create_tasks([("t1", "One", "pending", "alice", 1)])
+        self.assertEqual(self.am.calculate_agent_load("alice"), 15)
+
+        self.am.conn.execute("INSERT INTO tasks (id, title, status, assignee, estimated_hours) "
+                             "VALUES ('t2', 'Two', 'pending', 'alice', 1)")
+        self.am.conn.commit()
+        with mock.patch("agent_manager._LOAD_TTL", 3600):
+            self.assertEqual(self.am.calculate_agent_load("alice"), 15)
+            self.am.track_workload("alice")
+            self.assertEqual(self.am.calculate_agent_load("alice"), 30)
+        with mock.patch("agent_manager._LOAD_TTL", 0):
+            self.am.conn.execute("UPDATE tasks SET status = 'cancelled' WHERE id = 't2'")
+            self.am.conn.commit()
+            self.assertEqual(self.am.calculate_agent_load("alice"), 15)
+
+    def test_receive_messages_marks_all_read(self):
+        """Received unread messages, direct and broadcast, are marked read together."""
+        self.am.register_agent("alice", "Alice")
+        self.am.register_agent("bob", "Bob")
+        self.am.send_message("alice", "bob", "hello")
+        self.am.send_message("alice", "bob", "urgent", priority="critical")
+        self.am.broadcast_message("alice", "everyone")
+
+        received = self.am.receive_messages("bob")
+
+        self.assertEqual([m["content"] for m in received][0], "urgent")
+        self.assertEqual(len(received), 3)
+        self.assertEqual(self.am.receive_messages("bob"), [])
+        self.assertEqual(len(self.am.receive_messages("bob", status="read")), 3)
+
+    def test_priority_rank_added_to_existing_tables(self):
+        """Databases without priority_rank gain it on open and sort by it."""
+        from agent_manager import AgentManager
+
+        self.am.register_agent("alice", "Alice")
+        self.am.send_message("alice", "alice", "later", priority="low")
+        self.am.send_message("alice", "alice", "first", priority="high")
+        self.am.conn.executescript("""
+            DROP INDEX IF EXISTS idx_msgs_recv;
+            ALTER TABLE agent_messages DROP COLUMN priority_rank;
+        """)
+
+        reopened = AgentManager(self.db_path)
+        try:
+            received = reopened.receive_messages("alice")
+        finally:
+            reopened.__exit__(None, None, None)
+        self.assertEqual([m["content"] for m in received], ["first", "later"])
+
+    def test_agent_metrics_aggregate_window(self):
+        """get_agent_metrics() aggregates only metrics inside the time range."""
+        self.am.register_agent("alice", "Alice")
+        for metric_type, value, task_id in [("task_completion", 1, "t1"), ("task_completion", 0, "t2"),
+                                            ("task_duration", 20, "t1"), ("task_duration", 40, "t2"),
+                                            ("quality_score", 90, None)]:
+            self.am.record_metric("alice", metric_type, value, task_id)
+        self.am.conn.execute(
+            "INSERT INTO agent_metrics (agent_id, metric_type, metric_value, task_id, recorded_at) "
+            "VALUES ('alice', 'task_completion', 0, 't3', datetime('now', '-3 days'))")
+        self.am.conn.commit()
+
+        daily = self.am.get_agent_metrics("alice")
+        self.assertEqual((daily["completion_rate"], daily["average_task_duration"],
+                          daily["quality_score"], daily["tasks_handled"]), (50, 30, 90, 2))
+        weekly = self.am.get_agent_metrics("alice", "weekly")
+        self.assertEqual((weekly["completion_rate"], weekly["tasks_handled"]), (33.33, 3))
+
+    def test_metrics_are_buffered_then_flushed(self):
+        """record_metric() batches rows until a flush or a metrics read."""
+        count = "SELECT COUNT(*) FROM agent_metrics"
+        self.am.register_agent("alice", "Alice")
+        with mock.patch("agent_manager._METRIC_FLUSH_INTERVAL", 3600):
+            self.assertTrue(self.am.record_metric("alice", "task_completion", 1, "t1"))
+            self.assertTrue(self.am.record_metric("alice", "quality_score", 80))
+            self.assertEqual(self.am.conn.execute(count).fetchone()[0], 0)
+
+            self.assertEqual(self.am.get_agent_metrics("alice")["tasks_handled"], 1)
+            self.assertEqual(self.am.conn.execute(count).fetchone()[0], 2)
+            self.assertEqual(self.am.flush_metrics(), 0)
+
+    def test_idle_metrics_flushed_in_background(self):
+        """A buffered metric is written once it has waited its interval."""
+        import sqlite3
+        import time
+
+        self.am.register_agent("alice", "Alice")
+        with mock.patch("agent_manager._METRIC_FLUSH_INTERVAL", 0.05):
+            self.assertTrue(self.am.record_metric("alice", "quality_score", 80))
+
+        deadline = time.monotonic() + 5
+        reader = sqlite3.connect(self.db_path)
+        try:
+            while time.monotonic() < deadline:
+                stored = reader.execute("SELECT COUNT(*) FROM agent_metrics").fetchone()[0]
+                if stored:
+                    break
+                time.sleep(0.02)
+        finally:
+            reader.close()
+        self.assertEqual(stored, 1)
+
+    def test_single_statement_writes_report_rowcount(self):
+        """Status and acknowledgement updates report whether a row matched."""
+        self.am.register_agent("alice", "Alice")
+        self.am.send_message("alice", "alice", "note")
+        message_id = self.am.receive_messages("alice")[0]["id"]
+
+        self.assertTrue(self.am.set_agent_status("alice", "busy"))
+        self.assertFalse(self.am.set_agent_status("nobody", "busy"))
+        self.assertTrue(self.am.acknowledge_message(message_id, "alice"))
+        self.assertFalse(self.am.acknowledge_message(message_id, "bob"))
+        self.assertEqual(self.am.get_agent("alice")["status"], "busy")
+
+    def test_connections_are_per_thread(self):
+        """Each thread gets its own tuned connection; __exit__ closes them all."""
+        import sqlite3
+        import threading
+
+        self.am.register_agent("alice", "Alice")
+        seen = {}
+
+        def worker():
+            seen["conn"] = self.am.conn
+            seen["agent"] = self.am.get_agent("alice")
+            seen["mode"] = self.am.conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(seen["conn"], self.am.conn)
+        self.assertIs(self.am.conn, self.am.conn)
+        self.assertEqual(seen["agent"]["name"], "Alice")
+        self.assertEqual(seen["mode"], 1)  # NORMAL
+        self.am.__exit__(None, None, None)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            seen["conn"].execute("SELECT 1")
+
+    def test_workload_rows_backfilled_on_open(self):
+        """Agents without a workload row still count as least loaded after reopening."""
+        from agent_manager import AgentManager
+
+        self.am.register_agent("alice", "Alice")
+        self.am.conn.execute("UPDATE agent_workload SET current_load_score = 40")
+        self.am.conn.execute("INSERT INTO agents (id, name, status) VALUES ('bob', 'Bob', 'active')")
+        self.am.conn.commit()
+
+        reopened = AgentManager(self.db_path)
+        try:
+            self.assertEqual(reopened.find_least_loaded_agent(), "bob")
+        finally:
+            reopened.__exit__(None, None, None)
+
+    def test_reregistering_updates_in_place(self):
+        """Re-registration updates the agent row without replacing it."""
+        self.am.register_agent("alice", "Alice", capabilities=["python"])
+        self.am.conn.execute("UPDATE agents SET registered_at = '2026-01-01 00:00:00', "
+                             "status = 'inactive', metadata = '{}'")
+        self.am.conn.commit()
+        rowid = self.am.conn.execute("SELECT rowid FROM agents WHERE id = 'alice'").fetchone()[0]
+
+        self.assertTrue(self.am.register_agent("alice", "Alice B", capabilities=["sql"]))
+
+        row = self.am.conn.execute(
+            "SELECT rowid, name, status, registered_at, metadata FROM agents WHERE id = 'alice'").fetchone()
+        self.assertEqual(tuple(row), (rowid, "Alice B", "active", "2026-01-01 00:00:00", "{}"))
+        self.assertEqual(self.am.get_agent("alice")["capabilities"], ["sql"])
+
+    def test_broadcast_fans_out_to_each_inbox(self):
+        """Each active agent reads and acknowledges a broadcast independently."""
+        self.am.register_agent("alice", "Alice")
+        self.am.register_agent("bob", "Bob")
+        self.am.register_agent("carol", "Carol")
+        self.am.set_agent_status("carol", "inactive")
+        self.am.broadcast_message("alice", "standup in 5")
+
+        bob_messages = self.am.receive_messages("bob")
+        self.assertEqual([m["content"] for m in bob_messages], ["standup in 5"])
+        self.assertEqual(bob_messages[0]["sender_name"], "Alice")
+        self.assertTrue(self.am.acknowledge_message(bob_messages[0]["id"], "bob"))
+
+        alice_messages = self.am.receive_messages("alice")
+        self.assertEqual([m["status"] for m in alice_messages], ["unread"])
+        self.assertEqual(self.am.receive_messages("carol"), [])
+        self.assertEqual(len(self.am.receive_messages("bob", status="acknowledged")), 1)
+        self.assertEqual(len(self.am.receive_messages("alice", status="read")), 1)
+
+    def test_inbox_backfilled_for_existing_messages(self):
+        """Databases from before the inbox keep their messages on reopen."""
+        from agent_manager import AgentManager
+
+        self.am.register_agent("alice", "Alice")
+        self.am.register_agent("bob", "Bob")
+        self.am.conn.executescript("""
+            DROP TABLE agent_message_inbox;
+            INSERT INTO agent_messages (from_agent, to_agent, message_type, content, status)
+            VALUES ('alice', 'bob', 'direct', 'direct note', 'unread'),
+                   ('alice', NULL, 'broadcast', 'old broadcast', 'read');
+        """)
+
+        reopened = AgentManager(self.db_path)
+        try:
+            unread = reopened.receive_messages("bob")
+            read = reopened.receive_messages("alice", status="read")
+        finally:
+            reopened.__exit__(None, None, None)
+        self.assertEqual([m["content"] for m in unread], ["direct note"])
+        self.assertEqual([m["content"] for m in read], ["old broadcast"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for AssessmentReporter's aggregation queries.
+@implements FR-037: 30-Day Assessment Report
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestAssessmentReporter(unittest.TestCase):
+    """AssessmentReporter tests against a throwaway project directory."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp(prefix="test_assessment_")
+        self.original_cwd = Path.cwd()
+        os.chdir(self.test_dir)
+
+        from tm_production import TaskManager
+        from assessment_reporter import AssessmentReporter
+        self.tm = TaskManager(agent_id_override="test_agent")
+        self.reporter = AssessmentReporter(self.tm.db_path)
+        self.since = (datetime.now() - timedelta(days=30)).isoformat()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        os.chdir(self.original_cwd)
+        if Path(self.test_dir).exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_executive_summary_counts_feature_usage(self):
+        """Feature adoption counts every feature each task uses."""
+        done = self.tm.add("Fix login bug", success_criteria='[{"criterion": "works"}]',
+                           estimated_hours=2)
+        self.tm.complete(done)
+        self.tm.add("Write guide", deadline="2030-01-01T00:00:00")
+        self.tm.add("Plain task")
+
+        summary = self.reporter._generate_executive_summary(self.since)
+
+        self.assertEqual(summary["total_tasks_created"], 3)
+        self.assertEqual(summary["tasks_completed"], 1)
+        self.assertEqual(summary["completion_rate_percent"], 33.3)
+        self.assertEqual(summary["feature_adoption_score"], 3)
+
+    def test_executive_summary_empty_window(self):
+        """An empty window reports zeros rather than NULLs."""
+        summary = self.reporter._generate_executive_summary(self.since)
+
+        self.assertEqual((summary["total_tasks_created"], summary["tasks_completed"],
+                          summary["feature_adoption_score"]), (0, 0, 0))
+
+    def test_adoption_patterns_share_one_grouping(self):
+        """Daily creation counts and feature trend cover the same days."""
+        self.tm.add("One", deadline="2030-01-01T00:00:00")
+        self.tm.add("Two", estimated_hours=1)
+
+        patterns = self.reporter._analyze_adoption_patterns(self.since)
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        self.assertEqual(patterns["daily_task_creation"], {today: 2})
+        self.assertEqual(patterns["feature_adoption_trend"],
+                         [{"day": today, "success_criteria": 0, "deadlines": 1, "estimation": 1}])
+        self.assertEqual(patterns["peak_usage_day"], today)
+
+    def test_template_usage_first_matching_category_wins(self):
+        """Each described task counts once, for the first category it matches."""
+        self.tm.add("Fix crash", description="add a regression test")
+        self.tm.add("Implement export", description="new feature")
+        self.tm.add("Study options", description="Investigate caching")
+        self.tm.add("Chores", description="tidy up")
+        self.tm.add("Bug without description")
+
+        usage = self.reporter._analyze_template_usage()
+
+        self.assertEqual(usage["template_usage_patterns"], {
+            "bug_fix": 1, "feature_development": 1, "research": 1,
+            "documentation": 0, "testing": 0,
+        })
+        self.assertEqual(usage["template_diversity"], 3)
+
+    def test_assessment_cached_until_data_changes(self):
+        """Repeated reports come from the disk cache until the database changes."""
+        from unittest import mock
+
+        self.tm.add("First")
+        report = self.reporter.generate_30_day_assessment()
+        self.assertEqual(report["executive_summary"]["total_tasks_created"], 1)
+
+        with mock.patch.object(self.reporter, "_build_30_day_assessment") as build:
+            self.assertEqual(self.reporter.generate_30_day_assessment(), report)
+            build.assert_not_called()
+
+        self.tm.add("Second")
+        refreshed = self.reporter.generate_30_day_assessment()
+        self.assertEqual(refreshed["executive_summary"]["total_tasks_created"], 2)
+        self.assertEqual(len(list(self.reporter.cache_dir.glob("assessment_*.json"))), 1)
+
+        self.reporter.invalidate_cache()
+        self.assertEqual(list(self.reporter.cache_dir.glob("assessment_*.json")), [])
+
+    def test_feedback_weekly_trends(self):
+        """Weekly averages are rounded, and a week without quality scores still reports timeliness."""
+        import sqlite3
+
+        Path(".task-orchestrator").mkdir(exist_ok=True)
+        now = datetime.now()
+        with sqlite3.connect(self.reporter.feedback_db_path) as conn:
+            conn.execute("CREATE TABLE feedback (task_id TEXT, quality_score INTEGER, "
+                         "timeliness_score INTEGER, feedback_date TEXT)")
+            conn.execute("CREATE TABLE rework_tracking (original_task_id TEXT, rework_date TEXT)")
+            conn.executemany("INSERT INTO feedback VALUES (?, ?, ?, ?)", [
+                ("a", 4, 5, (now - timedelta(days=14)).isoformat()),
+                ("b", 5, 4, (now - timedelta(days=14)).isoformat()),
+                ("c", 3, 3, (now - timedelta(days=14)).isoformat()),
+                ("d", None, 2, now.isoformat()),
+            ])
+            conn.execute("INSERT INTO rework_tracking VALUES ('a', ?)", (now.isoformat(),))
+
+        trends = self.reporter._analyze_feedback_trends(self.since)
+
+        first, last = trends["weekly_trends"]
+        self.assertEqual((first["avg_quality"], first["avg_timeliness"], first["feedback_count"]), (4.0, 4.0, 3))
+        self.assertEqual((last["avg_quality"], last["avg_timeliness"], last["feedback_count"]), (0, 2.0, 1))
+        self.assertEqual(trends["rework_analysis"]["total_rework_tasks"], 1)
+        self.assertEqual(trends["rework_analysis"]["avg_original_quality"], 4.0)
+        self.assertEqual(trends["quality_trend"], "stable")
+
+    def test_report_run_opens_each_database_once(self):
+        """All analyses of one report share a connection per database."""
+        from unittest import mock
+
+        self.tm.add("Fix crash", description="add a regression test")
+        Path(self.reporter.feedback_db_path).parent.mkdir(exist_ok=True)
+        self.test_feedback_weekly_trends()
+
+        with mock.patch.object(self.reporter, "_open_connection",
+                               wraps=self.reporter._open_connection) as opened:
+            report = self.reporter.generate_30_day_assessment(force_refresh=True)
+
+        self.assertEqual(sorted(str(call.args[0]) for call in opened.call_args_list),
+                         sorted([str(self.tm.db_path), self.reporter.feedback_db_path]))
+        self.assertEqual(report["executive_summary"]["total_tasks_created"], 1)
+        self.assertEqual(len(report["feedback_analysis"]["weekly_trends"]), 2)
+        self.assertEqual(self.reporter._connections, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
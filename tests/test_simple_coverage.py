@@ -85,6 +85,19 @@ class TestSimpleCoverage(unittest.TestCase):
         # Should create notification directory
         self.assertTrue(Path(".task-orchestrator/notifications").exists())
     
+    def test_task_priority_ordering(self):
+        """Test task priorities compare as integers and round-trip to strings."""
+        from tm_production import Priority
+        
+        self.assertGreater(Priority.HIGH, Priority.MEDIUM)
+        self.assertGreater(Priority.MEDIUM, Priority.LOW)
+        self.assertIs(Priority.parse("high"), Priority.HIGH)
+        self.assertIs(Priority.parse(Priority.LOW), Priority.LOW)
+        self.assertEqual(str(Priority.MEDIUM), "medium")
+        
+        with self.assertRaises(ValueError):
+            Priority.parse("super-urgent")
+    
     def test_retry_utils_basic(self):
         """Test retry utilities basic functionality."""
         from retry_utils import calculate_backoff_delay, RetryConfig
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Tests for TaskManager batch and query helpers.
+@implements FR-CORE-1: Task Creation System
+@implements FR-003: Task Dependency System
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestTaskManager(unittest.TestCase):
+    """TaskManager tests against a throwaway project directory."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp(prefix="test_tm_")
+        self.original_cwd = Path.cwd()
+        os.chdir(self.test_dir)
+
+        from tm_production import TaskManager
+        self.tm = TaskManager(agent_id_override="test_agent")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        os.chdir(self.original_cwd)
+        if Path(self.test_dir).exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_add_many_resolves_batch_dependencies(self):
+        """Batch entries can depend on each other and on existing tasks."""
+        done_id = self.tm.add("Already done")
+        self.tm.complete(done_id)
+
+        ids = self.tm.add_many([
+            {"title": "Design", "priority": "high", "depends_on": [done_id]},
+            {"title": "Build", "depends_on": [0]},
+        ])
+
+        self.assertEqual(len(ids), 2)
+        design, build = (self.tm.show(task_id) for task_id in ids)
+        self.assertEqual(design["status"], "pending")
+        self.assertEqual(design["priority"], "high")
+        self.assertEqual(build["status"], "blocked")
+        self.assertEqual(build["dependencies"], [ids[0]])
+
+    def test_add_many_rejects_cycles_and_unknown_ids(self):
+        """Invalid batches are rejected before anything is written."""
+        with self.assertRaises(ValueError):
+            self.tm.add_many([
+                {"title": "A", "depends_on": [1]},
+                {"title": "B", "depends_on": [0]},
+            ])
+        with self.assertRaises(ValueError):
+            self.tm.add_many([{"title": "C", "depends_on": ["deadbeef"]}])
+
+        self.assertEqual(self.tm.list(), [])
+
+    def test_add_many_stores_core_loop_fields(self):
+        """Fields add() accepts are stored; unknown keys and bad dependencies are rejected."""
+        criteria = '[{"criterion": "works"}]'
+        task_id, = self.tm.add_many([{"title": "Ship", "deadline": "2030-01-01T00:00:00",
+                                      "estimated_hours": 3, "success_criteria": criteria}])
+
+        task = self.tm.show(task_id)
+        self.assertEqual((task["deadline"], task["estimated_hours"], task["success_criteria"]),
+                         ("2030-01-01T00:00:00", 3, criteria))
+        with self.assertRaises(ValueError):
+            self.tm.add_many([{"title": "Tagged", "tags": ["x"]}])
+        with self.assertRaises(ValueError):
+            self.tm.add_many([{"title": "Float dep", "depends_on": [1.0]}])
+        # Same validation (and error type) as add()
+        from error_handler import ValidationError
+        with self.assertRaises((ValueError, ValidationError)):
+            self.tm.add_many([{"title": "Bad criteria", "success_criteria": "[1]"}])
+        self.assertEqual(len(self.tm.list()), 1)
+
+    def test_add_dependencies_blocks_and_rejects_cycles(self):
+        """Bulk edges block dependents and refuse to close a cycle."""
+        first, second, third = (self.tm.add(title) for title in ("First", "Second", "Third"))
+
+        added = self.tm.add_dependencies([(second, first), (third, second), (third, second)])
+
+        self.assertEqual(added, 2)
+        self.assertEqual(self.tm.show(second)["status"], "blocked")
+        self.assertEqual(self.tm.show(first)["status"], "pending")
+        with self.assertRaises(ValueError):
+            self.tm.add_dependencies([(first, third)])
+
+    def test_aggregate_counts_in_sql(self):
+        """aggregate() groups by whitelisted columns only."""
+        self.tm.add("One", priority="high")
+        self.tm.add("Two", priority="high")
+        self.tm.add("Three", priority="low")
+
+        self.assertEqual(self.tm.aggregate("priority"), {"high": 2, "low": 1})
+        self.assertEqual(self.tm.aggregate("status"), {"pending": 3})
+        with self.assertRaises(ValueError):
+            self.tm.aggregate("title; DROP TABLE tasks")
+
+    def test_count_by_status_filters_by_assignee(self):
+        """count_by_status() groups in SQL, overall or for one assignee."""
+        first = self.tm.add("One", assignee="alice")
+        self.tm.add("Two", assignee="alice")
+        self.tm.add("Three", assignee="bob")
+        self.tm.complete(first)
+
+        self.assertEqual(self.tm.count_by_status(), {"completed": 1, "pending": 2})
+        self.assertEqual(self.tm.count_by_status("alice"), {"completed": 1, "pending": 1})
+        self.assertEqual(self.tm.count_by_status("nobody"), {})
+
+    def test_list_unassigned_filters_in_sql(self):
+        """list(unassigned=True) skips tasks that have an assignee."""
+        free = self.tm.add("Free")
+        self.tm.add("Taken", assignee="alice")
+        done = self.tm.add("Done")
+        self.tm.complete(done)
+
+        self.assertEqual([t["id"] for t in self.tm.list(status="pending", unassigned=True)], [free])
+        self.assertEqual(len(self.tm.list(unassigned=True)), 2)
+
+    def test_assign_many_updates_in_one_call(self):
+        """assign_many() applies every pair and skips unknown IDs."""
+        first, second = self.tm.add("First"), self.tm.add("Second")
+
+        updated = self.tm.assign_many([(first, "alice"), (second, "bob"), ("deadbeef", "carol")])
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(self.tm.show(first)["assignee"], "alice")
+        self.assertEqual(self.tm.show(second)["assignee"], "bob")
+        with self.assertRaises(ValueError):
+            self.tm.assign_many([(first, "")])
+
+    def test_list_cache_invalidated_by_writes(self):
+        """Cached list() results are dropped as soon as any connection writes."""
+        from tm_production import TaskManager
+
+        task_id = self.tm.add("Cached")
+        first = self.tm.list()
+        first[0]["title"] = "mutated by caller"
+        self.assertEqual(self.tm.list()[0]["title"], "Cached")
+
+        self.tm.update(task_id, status="in_progress")
+        self.assertEqual(self.tm.list()[0]["status"], "in_progress")
+
+        TaskManager(agent_id_override="other_agent").add("From another manager")
+        self.assertEqual(len(self.tm.list()), 2)
+
+    def test_watch_many_groups_by_agent(self):
+        """watch_many() delivers per-agent and broadcast notifications once."""
+        import sqlite3
+
+        with sqlite3.connect(str(self.tm.db_path)) as conn:
+            conn.executemany(
+                "INSERT INTO notifications (agent_id, task_id, type, message, created_at) "
+                "VALUES (?, NULL, 'info', ?, ?)",
+                [("alice", "for alice", "2026-01-01"), ("bob", "for bob", "2026-01-02"),
+                 (None, "for everyone", "2026-01-03"), ("carol", "not asked for", "2026-01-04")],
+            )
+
+        notes = self.tm.watch_many(["alice", "bob"])
+
+        self.assertEqual([n["message"] for n in notes["alice"]], ["for everyone", "for alice"])
+        self.assertEqual([n["message"] for n in notes["bob"]], ["for everyone", "for bob"])
+        self.assertEqual(self.tm.watch_many(["alice", "bob"]), {"alice": [], "bob": []})
+        self.assertEqual(len(self.tm.watch_many(["carol"])["carol"]), 1)
+
+    def test_list_columns_returns_parallel_lists(self):
+        """list_columns() transposes the requested fields in list() order."""
+        self.tm.add("One", priority="high", assignee="alice")
+        self.tm.add("Two", priority="low")
+
+        columns = self.tm.list_columns(["id", "priority", "assignee"])
+
+        tasks = self.tm.list()
+        self.assertEqual(columns["id"], [t["id"] for t in tasks])
+        self.assertEqual(columns["priority"], [t["priority"] for t in tasks])
+        self.assertEqual(columns["assignee"], [t["assignee"] for t in tasks])
+        with self.assertRaises(ValueError):
+            self.tm.list_columns(["status", "context"])
+
+    def test_export_to_stream_matches_list(self):
+        """Streaming JSON export serializes the same rows as list()."""
+        import io
+        import json
+
+        self.tm.add("Alpha", description="line one\nline two")
+        self.tm.add("Beta", priority="low")
+
+        buffer = io.StringIO()
+        self.tm.export_to_stream(buffer, format="json")
+        self.assertEqual(json.loads(buffer.getvalue()), self.tm.list())
+        self.assertEqual(buffer.getvalue(), json.dumps(self.tm.list(), indent=2))
+
+    def test_connection_is_shared(self):
+        """connection() hands back the same connection with its PRAGMAs intact."""
+        with self.tm.connection() as conn:
+            conn.execute("PRAGMA cache_size=-4096")
+        with self.tm.connection() as again:
+            self.assertIs(again, conn)
+            self.assertEqual(again.execute("PRAGMA cache_size").fetchone()[0], -4096)
+        self.tm.close()
+        with self.tm.connection() as reopened:
+            self.assertIsNot(reopened, conn)
+
+    def test_show_uses_one_reader_per_thread(self):
+        """show() reuses a connection per thread and sees later writes."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        task_id = self.tm.add("Lookup")
+        self.assertEqual(self.tm.show(task_id)["status"], "pending")
+        reader = self.tm._reader()
+        self.tm.update(task_id, status="in_progress")
+        self.assertEqual(self.tm.show(task_id)["status"], "in_progress")
+        self.assertIs(self.tm._reader(), reader)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            titles = list(pool.map(lambda _: self.tm.show(task_id)["title"], range(4)))
+            other = pool.submit(self.tm._reader).result()
+        self.assertEqual(titles, ["Lookup"] * 4)
+        self.assertIsNot(other, reader)
+
+        # close() closes every thread's reader; the next lookup reopens
+        import sqlite3
+        self.tm.close()
+        for conn in (reader, other):
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        self.assertEqual(self.tm.show(task_id)["title"], "Lookup")
+        self.assertIsNot(self.tm._reader(), reader)
+
+
+if __name__ == "__main__":
+    unittest.main()